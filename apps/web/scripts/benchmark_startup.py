@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Script to measure the startup time of the translation commands.
+Launches run_translations.py <command> --help repeatedly, which imports the
+command module and builds its parser without touching any message files,
+and compares it with the startup time of a bare interpreter.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+
+
+RUNNER = Path(__file__).parent / 'run_translations.py'
+
+
+def time_process(cmd: List[str], runs: int) -> List[float]:
+    """Run a command several times and return the wall time of each run in ms."""
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def benchmark_startup(commands: List[str], runs: int = 10) -> Dict[str, List[float]]:
+    """Measure the startup of each command and print a summary table."""
+    results = {'(python)': time_process([sys.executable, '-c', 'pass'], runs)}
+
+    for command in commands:
+        results[command] = time_process([sys.executable, str(RUNNER), command, '--help'], runs)
+
+    baseline = statistics.median(results['(python)'])
+
+    print(f"⏱️  STARTUP TIME ({runs} runs each)")
+    print("=" * 60)
+    print(f"{'COMMAND':<16} {'MEDIAN':<12} {'MIN':<12} {'OVERHEAD':<12}")
+    print("-" * 60)
+
+    for command, timings in results.items():
+        median = statistics.median(timings)
+        overhead = '' if command == '(python)' else f"{median - baseline:+.1f} ms"
+        print(f"{command:<16} {median:>7.1f} ms   {min(timings):>7.1f} ms   {overhead}")
+
+    print("=" * 60)
+    print("💡 OVERHEAD is the time spent on top of a bare interpreter launch")
+
+    return results
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=10,
+        help='Number of launches per command (default: 10)'
+    )
+    parser.add_argument(
+        '--commands',
+        nargs='+',
+        default=['help', 'check', 'sync', 'clean', 'compile'],
+        help='Commands to measure (default: help check sync clean compile)'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
+    if args.runs < 1:
+        print("--runs must be at least 1")
+        return 1
+
+    try:
+        benchmark_startup(args.commands, args.runs)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Command failed: {' '.join(e.cmd)}")
+        return 1
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Measure the startup time of the translation commands'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Script to check that product terms are translated consistently.
+Each locale can have a glossary mapping source terms to their required
+translation; every reference string containing a term must use that
+translation in the locale. Variants declared in the locale inheritance
+graph are checked on their resolved strings, including inherited ones.
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import argparse
+
+from sync_translations import load_locale_graph, topological_order, with_ancestors, resolve_locales
+
+
+TO_TRANSLATE_PREFIX = '[TO_TRANSLATE]'
+
+
+def load_json_file(file_path: Path) -> Dict[str, Any]:
+    """Load a JSON file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return {}
+
+
+def get_all_string_values(data: Dict[str, Any], prefix: str = '') -> List[Tuple[str, str]]:
+    """Extract all strings from nested JSON with their keys."""
+    strings = []
+
+    for key, value in data.items():
+        current_key = f"{prefix}.{key}" if prefix else key
+
+        if isinstance(value, str):
+            strings.append((current_key, value))
+        elif isinstance(value, dict):
+            strings.extend(get_all_string_values(value, current_key))
+
+    return strings
+
+
+class AhoCorasick:
+    """Multi-pattern matcher that finds every term in a text in one scan."""
+
+    def __init__(self, terms: List[str]):
+        self.terms = terms
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for index, term in enumerate(terms):
+            node = 0
+            for char in term:
+                if char not in self.goto[node]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[node][char] = len(self.goto) - 1
+                node = self.goto[node][char]
+            self.output[node].append(index)
+
+        # Breadth-first pass to link every node to its longest proper suffix
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def search(self, text: str) -> List[Tuple[int, int]]:
+        """Return (start, term index) for every occurrence of every term."""
+        matches = []
+        node = 0
+
+        for position, char in enumerate(text):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            for index in self.output[node]:
+                matches.append((position - len(self.terms[index]) + 1, index))
+
+        return matches
+
+
+def is_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not part of a longer word."""
+    before = text[start - 1] if start > 0 else ' '
+    after = text[end] if end < len(text) else ' '
+    return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
+
+
+def find_terms(automaton: AhoCorasick, text: str) -> List[Tuple[int, int, str]]:
+    """Find all whole-word, case-insensitive term occurrences as (start, end, term)."""
+    lowered = text.lower()
+    found = []
+
+    for start, index in automaton.search(lowered):
+        term = automaton.terms[index]
+        end = start + len(term)
+        if is_word_boundary(lowered, start, end):
+            found.append((start, end, term))
+
+    return found
+
+
+def select_longest(occurrences: List[Tuple[int, int, str]], terms: Dict[str, Any]) -> List[str]:
+    """Keep the leftmost-longest non-overlapping occurrences of a locale's terms.
+
+    This way "Reverse Share" is checked as one term instead of also
+    requiring the translation of "Share".
+    """
+    candidates = sorted(
+        (o for o in occurrences if o[2] in terms),
+        key=lambda o: (o[0], -(o[1] - o[0]))
+    )
+
+    selected = []
+    last_end = -1
+    for start, end, term in candidates:
+        if start >= last_end:
+            selected.append(term)
+            last_end = end
+
+    return selected
+
+
+def load_glossaries(glossary_dir: Path) -> Tuple[Dict[str, Dict[str, Tuple[str, List[str]]]], List[str]]:
+    """Load every <locale>.json glossary as lowercase term -> (term, accepted translations).
+
+    Each glossary must be an object mapping a term to a translation or a
+    list of accepted translations. Returns the glossaries and a description
+    of every invalid file or entry; invalid entries are left out.
+    """
+    glossaries = {}
+    problems = []
+
+    for glossary_file in sorted(glossary_dir.glob('*.json')):
+        locale = glossary_file.stem
+        try:
+            with open(glossary_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            problems.append(f"{locale}: cannot read {glossary_file.name}: {e}")
+            continue
+
+        if not isinstance(data, dict):
+            problems.append(f"{locale}: {glossary_file.name} must be an object mapping terms to translations")
+            continue
+
+        entries = {}
+        for term, translations in data.items():
+            if isinstance(translations, str):
+                translations = [translations]
+            if not term.strip():
+                problems.append(f"{locale}: empty term")
+                continue
+            if not isinstance(translations, list) or not translations or \
+                    not all(isinstance(option, str) and option for option in translations):
+                problems.append(f"{locale}: \"{term}\" must map to a non-empty string or list of strings")
+                continue
+            entries[term.lower()] = (term, translations)
+        if entries:
+            glossaries[locale] = entries
+
+    return glossaries, problems
+
+
+def check_glossary(messages_dir: Path, glossary_dir: Path, reference_file: str = 'en-US.json',
+                   locale_graph: Optional[Path] = None) -> int:
+    """Report strings that do not use the glossary translation.
+
+    Returns the number of violations plus invalid glossary files and
+    entries, or 1 if the reference file or the locale graph is invalid.
+    """
+    reference_path = messages_dir / reference_file
+    if not reference_path.exists():
+        print(f"Reference file not found: {reference_path}")
+        return 1
+
+    # A missing directory just means no language has a glossary yet
+    glossaries, problems = load_glossaries(glossary_dir)
+    for problem in problems:
+        print(f"❌ {problem}")
+    if not glossaries:
+        if not problems:
+            print(f"No glossary files found in {glossary_dir}")
+        return len(problems)
+
+    reference_data = load_json_file(reference_path)
+    reference_strings = dict(get_all_string_values(reference_data))
+    reference_locale = reference_path.stem
+    locales = [f.stem for f in messages_dir.glob('*.json') if f.name != reference_file]
+
+    try:
+        parents = load_locale_graph(locale_graph, locales, reference_locale)
+        order = topological_order(parents, reference_locale)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    # Only the locales with a glossary and their ancestors are resolved
+    order = with_ancestors(order, set(glossaries) & set(parents), parents, reference_locale)
+    resolved = resolve_locales(messages_dir, reference_locale, reference_data, parents, order)
+
+    # One automaton over the terms of every glossary, and one scan per
+    # reference string shared by all locales
+    all_terms = sorted({term for entries in glossaries.values() for term in entries})
+    automaton = AhoCorasick(all_terms)
+    occurrences = {}
+    for key, text in reference_strings.items():
+        found = find_terms(automaton, text)
+        if found:
+            occurrences[key] = found
+
+    print(f"📖 GLOSSARY REPORT")
+    print(f"Reference: {reference_file} ({len(all_terms)} glossary terms, used in {len(occurrences)} strings)")
+    print("=" * 80)
+
+    total_violations = 0
+
+    for locale, entries in sorted(glossaries.items()):
+        if locale not in parents:
+            print(f"⚠️  {locale}: glossary has no matching messages file")
+            continue
+        if locale not in resolved:
+            print(f"❌ {locale}: messages could not be loaded")
+            problems.append(f"{locale}: messages could not be loaded")
+            continue
+
+        locale_strings = dict(get_all_string_values(resolved[locale]))
+        violations = []
+        checked = 0
+
+        for key, found in occurrences.items():
+            translation = locale_strings.get(key)
+            if translation is None or translation.startswith(TO_TRANSLATE_PREFIX):
+                continue
+
+            lowered = translation.lower()
+            for term in select_longest(found, entries):
+                checked += 1
+                display_term, accepted = entries[term]
+                if not any(option.lower() in lowered for option in accepted):
+                    violations.append((key, display_term, accepted, translation))
+
+        total_violations += len(violations)
+
+        if not violations:
+            print(f"✅ {locale}: {checked} term uses consistent")
+            continue
+
+        print(f"🔴 {locale}: {len(violations)}/{checked} term uses inconsistent")
+        for key, term, accepted, translation in violations[:10]:
+            print(f"   - {key}: \"{term}\" should be \"{' / '.join(accepted)}\"")
+            print(f"     {translation[:70]}")
+        if len(violations) > 10:
+            print(f"   ... and {len(violations) - 10} more")
+
+    print("=" * 80)
+    if problems:
+        print(f"❌ {len(problems)} invalid glossary files or entries")
+    if total_violations:
+        print(f"❌ {total_violations} glossary violations found")
+    elif not problems:
+        print("🎉 All glossary terms are translated consistently!")
+
+    return total_violations + len(problems)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
+    parser.add_argument(
+        '--messages-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'messages',
+        help='Directory containing message files (default: ../messages)'
+    )
+    parser.add_argument(
+        '--glossary-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'glossary',
+        help='Directory containing <locale>.json glossaries (default: ../glossary)'
+    )
+    parser.add_argument(
+        '--locale-graph',
+        type=Path,
+        default=Path(__file__).parent.parent / 'locale-graph.json',
+        help='Locale inheritance graph (default: ../locale-graph.json, optional)'
+    )
+    parser.add_argument(
+        '--reference',
+        default='en-US.json',
+        help='Reference file (default: en-US.json)'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
+    if not args.messages_dir.exists():
+        print(f"Directory not found: {args.messages_dir}")
+        return 1
+
+    violations = check_glossary(args.messages_dir, args.glossary_dir, args.reference, args.locale_graph)
+    return 1 if violations else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Check that glossary terms are translated consistently'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -5,9 +5,14 @@ Script to check translation status and identify strings that need translation.
 
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional, Set
 import argparse
 
+from sync_translations import (
+    load_locale_graph, load_locale_file, topological_order, parse_shard, assign_shards, with_ancestors,
+    split_overlay, resolve_locale
+)
+
 
 def load_json_file(file_path: Path) -> Dict[str, Any]:
     """Load a JSON file."""
@@ -34,6 +39,22 @@ def get_all_string_values(data: Dict[str, Any], prefix: str = '') -> List[Tuple[
     return strings
 
 
+def get_entry_size(key: str, value: str) -> int:
+    """Approximate the payload bytes of a single "key": "value" entry."""
+    entry = f"{json.dumps(key, ensure_ascii=False)}:{json.dumps(value, ensure_ascii=False)},"
+    return len(entry.encode('utf-8'))
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for the report."""
+    return f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+
+
+def find_untranslated_keys(strings: List[Tuple[str, str]]) -> List[str]:
+    """List the keys of strings still marked as [TO_TRANSLATE]."""
+    return [key for key, value in strings if value.startswith('[TO_TRANSLATE]')]
+
+
 def check_untranslated_strings(file_path: Path) -> Tuple[int, int, List[str]]:
     """Check for untranslated strings in a file."""
     data = load_json_file(file_path)
@@ -41,11 +62,7 @@ def check_untranslated_strings(file_path: Path) -> Tuple[int, int, List[str]]:
         return 0, 0, []
     
     all_strings = get_all_string_values(data)
-    untranslated = []
-    
-    for key, value in all_strings:
-        if value.startswith('[TO_TRANSLATE]'):
-            untranslated.append(key)
+    untranslated = find_untranslated_keys(all_strings)
     
     return len(all_strings), len(untranslated), untranslated
 
@@ -58,11 +75,14 @@ def compare_languages(reference_file: Path, target_file: Path) -> Dict[str, Any]
     if not reference_data or not target_data:
         return {}
     
-    reference_strings = dict(get_all_string_values(reference_data))
-    target_strings = dict(get_all_string_values(target_data))
-    
-    # Find common keys
-    common_keys = set(reference_strings.keys()) & set(target_strings.keys())
+    return compare_strings(dict(get_all_string_values(reference_data)),
+                           dict(get_all_string_values(target_data)))
+
+
+def compare_strings(reference_strings: Dict[str, str], target_strings: Dict[str, str]) -> Dict[str, Any]:
+    """Compare the strings of a language with the reference strings."""
+    # Find common keys, in reference order so reports are deterministic
+    common_keys = [key for key in reference_strings if key in target_strings]
     
     # Check identical strings (possibly untranslated)
     identical_strings = []
@@ -70,61 +90,210 @@ def compare_languages(reference_file: Path, target_file: Path) -> Dict[str, Any]
         if reference_strings[key] == target_strings[key] and len(reference_strings[key]) > 3:
             identical_strings.append(key)
     
+    # Keys removed from the reference still shipped in the target
+    orphan_keys = sorted(set(target_strings.keys()) - set(reference_strings.keys()))
+    
     return {
         'total_reference': len(reference_strings),
         'total_target': len(target_strings),
         'common_keys': len(common_keys),
-        'identical_strings': identical_strings
+        'identical_strings': identical_strings,
+        'orphan_keys': orphan_keys,
+        'orphan_bytes': sum(get_entry_size(key.split('.')[-1], target_strings[key]) for key in orphan_keys)
+    }
+
+
+def analyze_locale_layers(messages_dir: Path, reference_locale: str, reference_data: Dict[str, Any],
+                          parents: Dict[str, str], order: List[str], only: Optional[Set[str]] = None
+                          ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Compute what every locale overrides and inherits in the locale graph.
+    
+    Resolved trees are cached per locale and reused by all of its children.
+    When only is given, layers are reported for those locales alone and
+    order only needs to hold them and their ancestors.
+    Returns the layers, the file data of the reported locales and the
+    resolved trees of the reported variants.
+    """
+    # Resolved trees hold translated keys only; nothing falls back to the reference
+    resolved = {reference_locale: {}}
+    depths = {reference_locale: 0}
+    layers = []
+    own_files = {}
+    variants = {}
+    
+    for locale in order:
+        parent = parents[locale]
+        own_data = load_locale_file(messages_dir / f"{locale}.json")
+        if own_data is None or parent not in resolved:
+            # Left unresolved, so the report shows the file as missing its strings
+            continue
+        resolved[locale] = resolve_locale(reference_data, resolved[parent], own_data)
+        depths[locale] = depths[parent] + 1
+        
+        if only is not None and locale not in only:
+            continue
+        
+        own_files[locale] = own_data
+        if parent != reference_locale:
+            variants[locale] = resolved[locale]
+        
+        parent_data = reference_data if parent == reference_locale else resolved[parent]
+        overrides, _, copies = split_overlay(reference_data, own_data, parent_data)
+        total = len(get_all_string_values(parent_data))
+        override_count = len(get_all_string_values(overrides))
+        
+        layers.append({
+            'locale': locale,
+            'parent': parent,
+            'depth': depths[locale],
+            'overrides': override_count,
+            'copies': len(copies),
+            'inherited': total - override_count - len(copies),
+            'total': total
+        })
+    
+    return layers, own_files, variants
+
+
+def print_locale_layers(layers: List[Dict[str, Any]], reference_locale: str) -> None:
+    """Print the locale inheritance tree with coverage at every layer."""
+    children = {}
+    for layer in layers:
+        children.setdefault(layer['parent'], []).append(layer)
+    
+    print("🧬 INHERITANCE LAYERS:")
+    print(f"{'LOCALE':<24} {'PARENT':<10} {'OVERRIDES':<12} {'INHERITED':<12} {'COPIES'}")
+    print("-" * 80)
+    print(f"   {reference_locale} (reference)")
+    
+    def print_children(parent: str):
+        for layer in children.get(parent, []):
+            name = "  " * layer['depth'] + layer['locale']
+            print(f"   {name:<21} {layer['parent']:<10} {layer['overrides']:<12} {layer['inherited']:<12} {layer['copies']}")
+            print_children(layer['locale'])
+    
+    print_children(reference_locale)
+    
+    # Layers whose parent is not part of this report (e.g. in a shard)
+    listed = {layer['locale'] for layer in layers}
+    for layer in layers:
+        if layer['parent'] not in listed and layer['parent'] != reference_locale:
+            print_children(layer['parent'])
+    print()
+
+
+def build_locale_report(reference_strings: Dict[str, str], json_file: Path, own_data: Dict[str, Any],
+                        resolved_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Collect the report data of a single translation file.
+    
+    Variants are reported from their resolved tree, so inherited keys count
+    as present; orphan keys always come from the file itself.
+    """
+    total_reference_strings = len(reference_strings)
+    own_strings = get_all_string_values(own_data)
+    strings = own_strings if resolved_data is None else get_all_string_values(resolved_data)
+    
+    comparison = compare_strings(reference_strings, dict(strings))
+    identical_strings = comparison['identical_strings']
+    
+    # Orphans are reported separately and must not count towards completeness
+    total_strings = comparison['common_keys']
+    untranslated_keys = find_untranslated_keys([(key, value) for key, value in strings if key in reference_strings])
+    untranslated_count = len(untranslated_keys)
+    if resolved_data is not None:
+        comparison = compare_strings(reference_strings, dict(own_strings))
+    
+    # Calculate percentages
+    completion_percentage = (total_strings / total_reference_strings) * 100 if total_reference_strings > 0 else 0
+    untranslated_percentage = (untranslated_count / total_strings) * 100 if total_strings > 0 else 0
+    
+    return {
+        'file': json_file.name,
+        'total_strings': total_strings,
+        'untranslated_count': untranslated_count,
+        'untranslated_keys': untranslated_keys,
+        'completion_percentage': completion_percentage,
+        'untranslated_percentage': untranslated_percentage,
+        'identical_strings': identical_strings,
+        # Reference text of the identical strings shown in the details, so
+        # partial reports can be printed without the reference file
+        'identical_values': {key: reference_strings.get(key, '')[:50] for key in identical_strings[:5]},
+        'orphan_keys': comparison['orphan_keys'],
+        'orphan_bytes': comparison['orphan_bytes']
     }
 
 
-def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US.json'):
-    """Generate complete translation report."""
+def collect_translation_reports(messages_dir: Path, reference_file: str = 'en-US.json',
+                                locale_graph: Optional[Path] = None,
+                                shard: Optional[Tuple[int, int]] = None) -> Optional[Dict[str, Any]]:
+    """Collect report data for all translation files, or only those of one shard.
+    
+    Returns None if the reference file or the locale graph is invalid.
+    """
     reference_path = messages_dir / reference_file
     if not reference_path.exists():
         print(f"Reference file not found: {reference_path}")
-        return
+        return None
     
     # Load reference data
     reference_data = load_json_file(reference_path)
     reference_strings = dict(get_all_string_values(reference_data))
-    total_reference_strings = len(reference_strings)
+    
+    # Find all JSON files
+    json_files = [f for f in messages_dir.glob('*.json') if f.name != reference_file]
+    reference_locale = reference_path.stem
+    
+    try:
+        parents = load_locale_graph(locale_graph, [f.stem for f in json_files], reference_locale)
+        order = topological_order(parents, reference_locale)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return None
+    
+    if shard:
+        selected = assign_shards(json_files, shard[1])[shard[0] - 1]
+        json_files = [f for f in json_files if f.stem in selected]
+        order = with_ancestors(order, selected, parents, reference_locale)
+    
+    # Overrides per inheritance layer, plus the file data and resolved
+    # trees of the reported locales, so no file is read twice
+    layers, own_files, variants = analyze_locale_layers(messages_dir, reference_locale, reference_data,
+                                                        parents, order, {f.stem for f in json_files})
+    
+    reports = [build_locale_report(reference_strings, json_file, own_files.get(json_file.stem, {}),
+                                   variants.get(json_file.stem))
+               for json_file in sorted(json_files)]
+    
+    return {
+        'reference_file': reference_file,
+        'total_reference_strings': len(reference_strings),
+        'shard': f"{shard[0]}/{shard[1]}" if shard else None,
+        'reports': reports,
+        'layers': layers
+    }
+
+
+def print_translation_report(results: Dict[str, Any]) -> None:
+    """Print the translation report from collected or merged report data."""
+    reference_file = results['reference_file']
+    total_reference_strings = results['total_reference_strings']
+    reports = sorted(results['reports'], key=lambda x: x['file'])
+    layers = results['layers']
     
     print(f"📊 TRANSLATION REPORT")
     print(f"Reference: {reference_file} ({total_reference_strings} strings)")
+    if results.get('shard'):
+        print(f"Shard: {results['shard']} ({len(reports)} files)")
     print("=" * 80)
     
-    # Find all JSON files
-    json_files = [f for f in messages_dir.glob('*.json') if f.name != reference_file]
-    
-    if not json_files:
+    if not reports:
         print("No translation files found")
         return
     
-    reports = []
-    
-    for json_file in sorted(json_files):
-        total_strings, untranslated_count, untranslated_keys = check_untranslated_strings(json_file)
-        comparison = compare_languages(reference_path, json_file)
-        
-        # Calculate percentages
-        completion_percentage = (total_strings / total_reference_strings) * 100 if total_reference_strings > 0 else 0
-        untranslated_percentage = (untranslated_count / total_strings) * 100 if total_strings > 0 else 0
-        
-        reports.append({
-            'file': json_file.name,
-            'total_strings': total_strings,
-            'untranslated_count': untranslated_count,
-            'untranslated_keys': untranslated_keys,
-            'completion_percentage': completion_percentage,
-            'untranslated_percentage': untranslated_percentage,
-            'identical_strings': comparison.get('identical_strings', [])
-        })
-    
     # Sort by completion percentage
     reports.sort(key=lambda x: x['completion_percentage'], reverse=True)
     
-    print(f"{'LANGUAGE':<15} {'COMPLETENESS':<12} {'STRINGS':<15} {'UNTRANSLATED':<15} {'POSSIBLE MATCHES'}")
+    print(f"{'LANGUAGE':<15} {'COMPLETENESS':<12} {'STRINGS':<15} {'UNTRANSLATED':<15} {'POSSIBLE MATCHES':<17} {'ORPHANS'}")
     print("-" * 80)
     
     for report in reports:
@@ -133,6 +302,7 @@ def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US
         strings_info = f"{report['total_strings']}/{total_reference_strings}"
         untranslated_info = f"{report['untranslated_count']} ({report['untranslated_percentage']:.1f}%)"
         identical_count = len(report['identical_strings'])
+        orphans_info = f"{len(report['orphan_keys'])} ({format_bytes(report['orphan_bytes'])})"
         
         # Choose icon based on completeness
         if report['completion_percentage'] >= 100:
@@ -142,12 +312,17 @@ def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US
         else:
             icon = "🔴"
         
-        print(f"{icon} {language:<13} {completion:<12} {strings_info:<15} {untranslated_info:<15} {identical_count}")
+        print(f"{icon} {language:<13} {completion:<12} {strings_info:<15} {untranslated_info:<15} {identical_count:<17} {orphans_info}")
     
     print("\n" + "=" * 80)
     
+    if any(layer['depth'] > 1 for layer in layers):
+        print_locale_layers(layers, Path(reference_file).stem)
+        print("=" * 80)
+    
     # Show details of problematic files
-    problematic_files = [r for r in reports if r['untranslated_count'] > 0 or r['completion_percentage'] < 100]
+    problematic_files = [r for r in reports if r['untranslated_count'] > 0 or r['completion_percentage'] < 100
+                         or r['orphan_keys']]
     
     if problematic_files:
         print("📋 DETAILS OF FILES THAT NEED ATTENTION:")
@@ -178,16 +353,20 @@ def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US
                 identical_count = len(report['identical_strings'])
                 print(f"   • {identical_count} strings identical to English (possibly untranslated)")
                 
-                if identical_count <= 5:
-                    for key in report['identical_strings']:
-                        value = reference_strings.get(key, '')[:50]
-                        print(f"     - {key}: \"{value}...\"")
-                else:
-                    for key in report['identical_strings'][:5]:
-                        value = reference_strings.get(key, '')[:50]
-                        print(f"     - {key}: \"{value}...\"")
+                for key in report['identical_strings'][:5]:
+                    value = report['identical_values'].get(key, '')
+                    print(f"     - {key}: \"{value}...\"")
+                if identical_count > 5:
                     print(f"     ... and {identical_count - 5} more")
             
+            if report['orphan_keys']:
+                orphan_count = len(report['orphan_keys'])
+                print(f"   • {orphan_count} orphan keys no longer in {reference_file} ({format_bytes(report['orphan_bytes'])})")
+                for key in report['orphan_keys'][:5]:
+                    print(f"     - {key}")
+                if orphan_count > 5:
+                    print(f"     ... and {orphan_count - 5} more")
+            
             print()
     
     else:
@@ -197,14 +376,102 @@ def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US
     print("💡 TIPS:")
     print("• Use 'python3 sync_translations.py --dry-run' to see what would be added")
     print("• Use 'python3 sync_translations.py' to synchronize all translations")
+    print("• Use 'python3 sync_translations.py --prune' to remove orphan keys")
     print("• Strings marked with [TO_TRANSLATE] need manual translation")
+    print("• Use 'python3 suggest_translations.py' to find similar strings already translated")
     print("• Strings identical to English may need translation")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Check translation status and identify strings that need translation'
-    )
+def save_report_json(file_path: Path, results: Dict[str, Any]) -> bool:
+    """Save collected report data as JSON for merging."""
+    try:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        return True
+    except Exception as e:
+        print(f"Error saving {file_path}: {e}")
+        return False
+
+
+def generate_translation_report(messages_dir: Path, reference_file: str = 'en-US.json',
+                                locale_graph: Optional[Path] = None,
+                                shard: Optional[Tuple[int, int]] = None,
+                                json_output: Optional[Path] = None) -> int:
+    """Generate complete translation report; return 1 if it could not be built."""
+    results = collect_translation_reports(messages_dir, reference_file, locale_graph, shard)
+    if results is None:
+        return 1
+    
+    print_translation_report(results)
+    
+    if json_output and save_report_json(json_output, results):
+        print(f"\n📁 Report data saved to: {json_output}")
+    
+    return 0
+
+
+def merge_translation_reports(report_files: List[Path]) -> int:
+    """Combine partial shard reports and print the full report."""
+    merged = None
+    seen_files = set()
+    seen_shards = set()
+    
+    for report_file in report_files:
+        partial = load_json_file(report_file)
+        if not partial:
+            return 1
+        
+        if merged is None:
+            merged = {
+                'reference_file': partial['reference_file'],
+                'total_reference_strings': partial['total_reference_strings'],
+                'shard': None,
+                'reports': [],
+                'layers': []
+            }
+        elif (partial['reference_file'], partial['total_reference_strings']) != \
+                (merged['reference_file'], merged['total_reference_strings']):
+            print(f"❌ {report_file} was generated from a different reference")
+            return 1
+        
+        for report in partial['reports']:
+            if report['file'] in seen_files:
+                print(f"❌ {report['file']} appears in more than one report")
+                return 1
+            seen_files.add(report['file'])
+            merged['reports'].append(report)
+        
+        merged['layers'].extend(partial['layers'])
+        if partial.get('shard'):
+            seen_shards.add(partial['shard'])
+    
+    if merged is None:
+        print("No reports to merge")
+        return 1
+    
+    # A partial merge would silently report fewer languages
+    totals = {int(shard.split('/')[1]) for shard in seen_shards}
+    if len(totals) > 1:
+        print(f"❌ Reports come from different shard counts: {', '.join(sorted(seen_shards))}")
+        return 1
+    if totals:
+        total = totals.pop()
+        missing = [f"{i}/{total}" for i in range(1, total + 1) if f"{i}/{total}" not in seen_shards]
+        if missing:
+            print(f"❌ Missing shards: {', '.join(missing)}")
+            return 1
+    
+    # Keep the layer tree in topological order
+    depth_order = {layer['locale']: layer['depth'] for layer in merged['layers']}
+    merged['layers'].sort(key=lambda layer: (depth_order[layer['locale']], layer['locale']))
+    
+    print_translation_report(merged)
+    return 0
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
     parser.add_argument(
         '--messages-dir', 
         type=Path,
@@ -216,15 +483,57 @@ def main():
         default='en-US.json',
         help='Reference file (default: en-US.json)'
     )
-    
-    args = parser.parse_args()
-    
+    parser.add_argument(
+        '--locale-graph',
+        type=Path,
+        default=Path(__file__).parent.parent / 'locale-graph.json',
+        help='Locale inheritance graph (default: ../locale-graph.json, optional)'
+    )
+    parser.add_argument(
+        '--shard',
+        type=parse_shard,
+        metavar='I/N',
+        help='Only check the files of shard I out of N (e.g. 1/4)'
+    )
+    parser.add_argument(
+        '--json-output',
+        type=Path,
+        help='Save the report data as JSON, e.g. to merge shard results later'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
     if not args.messages_dir.exists():
         print(f"Directory not found: {args.messages_dir}")
         return 1
     
-    generate_translation_report(args.messages_dir, args.reference)
-    return 0
+    return generate_translation_report(args.messages_dir, args.reference, args.locale_graph,
+                                       args.shard, args.json_output)
+
+
+def add_merge_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the arguments of the merge-reports command."""
+    parser.add_argument(
+        'reports',
+        type=Path,
+        nargs='+',
+        metavar='FILE',
+        help='JSON files written by check --json-output'
+    )
+
+
+def run_merge(args: argparse.Namespace) -> int:
+    """Print the full report from sharded JSON reports."""
+    return merge_translation_reports(args.reports)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Check translation status and identify strings that need translation'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
 
 
 if __name__ == '__main__':
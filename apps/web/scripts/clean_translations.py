@@ -8,7 +8,7 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import argparse
 
 
@@ -142,10 +142,8 @@ def clean_translations(messages_dir: Path, exclude_reference: str = 'en-US.json'
         print(f"\n🎉 Successfully cleaned {stats['cleaned']} files!")
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Clean up translation files with multiple [TO_TRANSLATE] prefixes'
-    )
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
     parser.add_argument(
         '--messages-dir', 
         type=Path,
@@ -162,9 +160,10 @@ def main():
         action='store_true',
         help='Only show what would be changed without making modifications'
     )
-    
-    args = parser.parse_args()
-    
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
     if not args.messages_dir.exists():
         print(f"Directory not found: {args.messages_dir}")
         return 1
@@ -183,5 +182,13 @@ def main():
     return 0
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Clean up translation files with multiple [TO_TRANSLATE] prefixes'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
 if __name__ == '__main__':
     exit(main()) 
\ No newline at end of file
@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+"""
+Script to precompile ICU messages and validate their syntax.
+Parses every message of every locale into an AST so syntax errors are caught
+at build time and the web app can consume catalogs without runtime parsing.
+Catalogs are written under content-hashed names listed in a manifest, so they
+can be cached immutably and unchanged locales keep their URLs across deploys.
+Sparse variants declared in the locale inheritance graph are resolved against
+their parent here, so their compiled catalogs are complete.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import argparse
+
+from sync_translations import load_locale_graph, topological_order, resolve_locales
+
+
+# Element types of the AST, matching the format used by intl-messageformat
+# (@formatjs/icu-messageformat-parser), so compiled messages can be handed
+# to the formatter as-is.
+TYPE_LITERAL = 0
+TYPE_ARGUMENT = 1
+TYPE_NUMBER = 2
+TYPE_DATE = 3
+TYPE_TIME = 4
+TYPE_SELECT = 5
+TYPE_PLURAL = 6
+TYPE_POUND = 7
+TYPE_TAG = 8
+
+# Skeleton types of number and date/time styles written as ::skeleton
+SKELETON_TYPE_NUMBER = 0
+SKELETON_TYPE_DATETIME = 1
+
+PLURAL_CATEGORIES = {'zero', 'one', 'two', 'few', 'many', 'other'}
+SIMPLE_ARGUMENT_TYPES = {'number': TYPE_NUMBER, 'date': TYPE_DATE, 'time': TYPE_TIME}
+
+NAME_PATTERN = re.compile(r'[^\s{}#,<>\'/]+')
+TAG_NAME_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9_.-]*')
+ARGUMENT_TYPE_PATTERN = re.compile(r'[A-Za-z]+')
+SELECTOR_PATTERN = re.compile(r'[^\s{}]+')
+OFFSET_PATTERN = re.compile(r'offset:\s*(-?\d+)')
+
+MANIFEST_FILE = 'manifest.json'
+HASH_LENGTH = 8
+HASHED_FILE_PATTERN = re.compile(r'^[A-Za-z0-9_-]+(\.[A-Za-z0-9_-]+)?\.[0-9a-f]{%d}\.json$' % HASH_LENGTH)
+
+
+class MessageSyntaxError(Exception):
+    """Raised when a message is not valid ICU MessageFormat syntax."""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(message)
+        self.offset = offset
+
+
+class MessageParser:
+    """Recursive descent parser for ICU MessageFormat strings."""
+
+    def __init__(self, message: str):
+        self.message = message
+        self.pos = 0
+
+    def parse(self) -> List[Dict[str, Any]]:
+        """Parse the whole message and return its AST."""
+        return self.parse_message(in_plural=False, close_brace=False, parent_tag=None)
+
+    def error(self, text: str, offset: Optional[int] = None) -> MessageSyntaxError:
+        return MessageSyntaxError(text, self.pos if offset is None else offset)
+
+    def peek(self, offset: int = 0) -> str:
+        index = self.pos + offset
+        return self.message[index] if index < len(self.message) else ''
+
+    def skip_whitespace(self) -> None:
+        while self.pos < len(self.message) and self.message[self.pos].isspace():
+            self.pos += 1
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            found = repr(self.peek()) if self.peek() else 'end of message'
+            raise self.error(f"Expected '{char}' but found {found}")
+        self.pos += 1
+
+    def read(self, pattern: 're.Pattern') -> str:
+        match = pattern.match(self.message, self.pos)
+        if not match:
+            return ''
+        self.pos = match.end()
+        return match.group(0)
+
+    def parse_message(self, in_plural: bool, close_brace: bool,
+                      parent_tag: Optional[str]) -> List[Dict[str, Any]]:
+        """Parse a sequence of literals, arguments and tags."""
+        elements = []
+        text = []
+
+        def flush_text():
+            if text:
+                elements.append({'type': TYPE_LITERAL, 'value': ''.join(text)})
+                text.clear()
+
+        while self.pos < len(self.message):
+            char = self.message[self.pos]
+
+            if char == '{':
+                flush_text()
+                elements.append(self.parse_argument())
+            elif char == '}' and close_brace:
+                # Outside of arguments '}' is literal text, as in formatjs
+                if parent_tag is not None:
+                    raise self.error(f"Unclosed tag <{parent_tag}>")
+                break
+            elif char == '#' and in_plural:
+                flush_text()
+                elements.append({'type': TYPE_POUND})
+                self.pos += 1
+            elif char == '<' and self.peek(1) == '/' and TAG_NAME_PATTERN.match(self.message, self.pos + 2):
+                if parent_tag is None:
+                    raise self.error("Unexpected closing tag")
+                break
+            elif char == '<' and TAG_NAME_PATTERN.match(self.message, self.pos + 1):
+                flush_text()
+                elements.append(self.parse_tag(in_plural, close_brace))
+            elif char == "'":
+                text.append(self.parse_quoted(in_plural))
+            else:
+                text.append(char)
+                self.pos += 1
+
+        flush_text()
+        return elements
+
+    def parse_quoted(self, in_plural: bool) -> str:
+        """Parse an apostrophe and any quoted literal text that follows it."""
+        following = self.peek(1)
+
+        if following == "'":
+            self.pos += 2
+            return "'"
+
+        if following not in ('{', '}', '<', '>') and not (following == '#' and in_plural):
+            self.pos += 1
+            return "'"
+
+        # Quoted section: everything up to the next lone apostrophe is literal
+        self.pos += 1
+        quoted = []
+        while self.pos < len(self.message):
+            char = self.message[self.pos]
+            if char == "'":
+                if self.peek(1) == "'":
+                    quoted.append("'")
+                    self.pos += 2
+                    continue
+                self.pos += 1
+                break
+            quoted.append(char)
+            self.pos += 1
+        return ''.join(quoted)
+
+    def parse_tag(self, in_plural: bool, close_brace: bool) -> Dict[str, Any]:
+        """Parse a rich text tag such as <b>...</b>.
+
+        Self-closing tags such as <br/> are kept as literal text, as the
+        formatjs parser does.
+        """
+        start = self.pos
+        self.pos += 1
+        name = self.read(TAG_NAME_PATTERN)
+        self.skip_whitespace()
+
+        if self.message.startswith('/>', self.pos):
+            self.pos += 2
+            return {'type': TYPE_LITERAL, 'value': f"<{name}/>"}
+        self.expect('>')
+
+        children = self.parse_message(in_plural, close_brace, parent_tag=name)
+
+        if not self.message.startswith('</', self.pos):
+            raise self.error(f"Unclosed tag <{name}>", start)
+        self.pos += 2
+        closing = self.read(TAG_NAME_PATTERN)
+        if closing != name:
+            raise self.error(f"Mismatched closing tag </{closing}> for <{name}>")
+        self.skip_whitespace()
+        self.expect('>')
+
+        return {'type': TYPE_TAG, 'value': name, 'children': children}
+
+    def parse_argument(self) -> Dict[str, Any]:
+        """Parse a {argument} placeholder, including formatted and plural forms."""
+        start = self.pos
+        self.pos += 1
+        self.skip_whitespace()
+
+        name = self.read(NAME_PATTERN)
+        if not name:
+            raise self.error("Expected argument name")
+        self.skip_whitespace()
+
+        if self.peek() == '}':
+            self.pos += 1
+            return {'type': TYPE_ARGUMENT, 'value': name}
+
+        if self.peek() != ',':
+            if not self.peek():
+                raise self.error(f"Unclosed argument '{{{name}'", start)
+            raise self.error(f"Expected ',' or '}}' after argument '{name}'")
+        self.pos += 1
+        self.skip_whitespace()
+
+        arg_type = self.read(ARGUMENT_TYPE_PATTERN)
+        self.skip_whitespace()
+
+        if arg_type in SIMPLE_ARGUMENT_TYPES:
+            style = None
+            if self.peek() == ',':
+                self.pos += 1
+                style_start = self.pos
+                while self.pos < len(self.message) and self.message[self.pos] not in '{}':
+                    self.pos += 1
+                style = self.message[style_start:self.pos].strip()
+                if not style:
+                    raise self.error(f"Expected style for '{name}'", style_start)
+                if style.startswith('::'):
+                    style = self.parse_skeleton(arg_type, style[2:].strip(), style_start)
+            self.expect('}')
+            return {'type': SIMPLE_ARGUMENT_TYPES[arg_type], 'value': name, 'style': style}
+
+        if arg_type in ('plural', 'selectordinal', 'select'):
+            self.expect(',')
+            return self.parse_options(name, arg_type, start)
+
+        if not arg_type:
+            raise self.error(f"Expected argument type for '{name}'")
+        raise self.error(f"Unknown argument type '{arg_type}'", self.pos - len(arg_type))
+
+    def parse_skeleton(self, arg_type: str, skeleton: str, start: int) -> Dict[str, Any]:
+        """Parse a ::skeleton style into the skeleton form used by intl-messageformat.
+
+        Skeletons are kept as written; like the formatjs parser's default,
+        they are not expanded into Intl options at build time.
+        """
+        if not skeleton:
+            raise self.error(f"Expected {arg_type} skeleton after '::'", start)
+
+        if arg_type != 'number':
+            return {'type': SKELETON_TYPE_DATETIME, 'pattern': skeleton, 'parsedOptions': {}}
+
+        tokens = []
+        for token in skeleton.split():
+            stem, *options = token.split('/')
+            if not stem or not all(options):
+                raise self.error(f"Invalid number skeleton '{skeleton}'", start)
+            tokens.append({'stem': stem, 'options': options})
+
+        return {'type': SKELETON_TYPE_NUMBER, 'tokens': tokens, 'parsedOptions': {}}
+
+    def parse_options(self, name: str, arg_type: str, start: int) -> Dict[str, Any]:
+        """Parse the options of a plural, selectordinal or select argument."""
+        is_plural = arg_type != 'select'
+        offset = 0
+
+        self.skip_whitespace()
+        if is_plural:
+            match = OFFSET_PATTERN.match(self.message, self.pos)
+            if match:
+                offset = int(match.group(1))
+                self.pos = match.end()
+
+        options = {}
+        while True:
+            self.skip_whitespace()
+            if self.peek() == '}':
+                self.pos += 1
+                break
+            if not self.peek():
+                raise self.error(f"Unclosed {arg_type} argument '{name}'", start)
+
+            selector_start = self.pos
+            selector = self.read(SELECTOR_PATTERN)
+            if not selector:
+                raise self.error(f"Expected selector in {arg_type} argument '{name}'")
+            if is_plural and not (selector in PLURAL_CATEGORIES or re.fullmatch(r'=-?\d+', selector)):
+                raise self.error(f"Invalid plural selector '{selector}'", selector_start)
+            if selector in options:
+                raise self.error(f"Duplicate selector '{selector}'", selector_start)
+
+            self.skip_whitespace()
+            self.expect('{')
+            value = self.parse_message(in_plural=is_plural, close_brace=True, parent_tag=None)
+            self.expect('}')
+            options[selector] = {'value': value}
+
+        if 'other' not in options:
+            raise self.error(f"Missing 'other' option in {arg_type} argument '{name}'", start)
+
+        if not is_plural:
+            return {'type': TYPE_SELECT, 'value': name, 'options': options}
+
+        return {
+            'type': TYPE_PLURAL,
+            'value': name,
+            'options': options,
+            'offset': offset,
+            'pluralType': 'ordinal' if arg_type == 'selectordinal' else 'cardinal'
+        }
+
+
+def parse_message(message: str) -> List[Dict[str, Any]]:
+    """Parse an ICU message into its AST, raising MessageSyntaxError if invalid."""
+    return MessageParser(message).parse()
+
+
+def load_json_file(file_path: Path) -> Dict[str, Any]:
+    """Load a JSON file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return {}
+
+
+def write_if_changed(file_path: Path, content: bytes) -> bool:
+    """Write a file unless it already has the same content; return True if written."""
+    if file_path.exists() and file_path.read_bytes() == content:
+        return False
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(file_path)
+    return True
+
+
+def save_hashed_file(output_dir: Path, name: str, data: Dict[str, Any]) -> Tuple[str, bool]:
+    """Save compact JSON under a content-hashed file name.
+    
+    Returns the file name and whether it had to be written; a file whose
+    hash already exists is left untouched.
+    """
+    content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    file_name = f"{name}.{digest}.json"
+    file_path = output_dir / file_name
+
+    if file_path.exists():
+        return file_name, False
+
+    write_if_changed(file_path, content)
+    return file_name, True
+
+
+def save_locale_artifacts(output_dir: Path, locale: str, compiled: Dict[str, Any],
+                          split_namespaces: bool = False) -> Tuple[Dict[str, Any], int]:
+    """Save a compiled locale (and optionally its namespaces) under hashed names.
+    
+    Returns the manifest entry for the locale and the number of files written.
+    """
+    file_name, written = save_hashed_file(output_dir, locale, compiled)
+    entry = {'file': file_name}
+    written_count = int(written)
+
+    if split_namespaces:
+        entry['namespaces'] = {}
+        for namespace, messages in compiled.items():
+            if not isinstance(messages, dict):
+                continue
+            namespace_file, written = save_hashed_file(output_dir, f"{locale}.{namespace}", messages)
+            entry['namespaces'][namespace] = namespace_file
+            written_count += int(written)
+
+    return entry, written_count
+
+
+def remove_stale_artifacts(output_dir: Path, manifest: Dict[str, Any]) -> List[str]:
+    """Delete hashed files from earlier builds that the manifest no longer lists."""
+    referenced = set()
+    for entry in manifest.values():
+        referenced.add(entry['file'])
+        referenced.update(entry.get('namespaces', {}).values())
+
+    removed = []
+    for file_path in sorted(output_dir.glob('*.json')):
+        if HASHED_FILE_PATTERN.match(file_path.name) and file_path.name not in referenced:
+            file_path.unlink()
+            removed.append(file_path.name)
+
+    return removed
+
+
+def compile_catalog(data: Dict[str, Any], prefix: str = '') -> Tuple[Dict[str, Any], List[Tuple[str, str, int]]]:
+    """Compile every message of a nested catalog, collecting syntax errors."""
+    compiled = {}
+    errors = []
+
+    for key, value in data.items():
+        current_key = f"{prefix}.{key}" if prefix else key
+
+        if isinstance(value, dict):
+            compiled[key], nested_errors = compile_catalog(value, current_key)
+            errors.extend(nested_errors)
+        elif isinstance(value, str):
+            try:
+                compiled[key] = parse_message(value)
+            except MessageSyntaxError as e:
+                errors.append((current_key, str(e), e.offset))
+        else:
+            compiled[key] = value
+
+    return compiled, errors
+
+
+def resolve_variants(messages_dir: Path, reference_file: str,
+                     locale_graph: Optional[Path]) -> Dict[str, Dict[str, Any]]:
+    """Resolve every variant of the locale graph into a complete catalog.
+
+    Locales inheriting directly from the reference are compiled as they
+    are; only variants are overlaid on their parent's translations. A
+    variant that cannot be loaded, or whose parent cannot, maps to None.
+    Raises ValueError if the locale graph is invalid.
+    """
+    reference_locale = Path(reference_file).stem
+    locales = [f.stem for f in messages_dir.glob('*.json') if f.name != reference_file]
+    parents = load_locale_graph(locale_graph, locales, reference_locale)
+
+    reference_data = load_json_file(messages_dir / reference_file)
+    resolved = resolve_locales(messages_dir, reference_locale, reference_data, parents,
+                               topological_order(parents, reference_locale))
+
+    return {locale: resolved.get(locale) for locale, parent in parents.items() if parent != reference_locale}
+
+
+def compile_messages(messages_dir: Path, output_dir: Path, check_only: bool = False,
+                     split_namespaces: bool = False, keep_stale: bool = False,
+                     reference_file: str = 'en-US.json', locale_graph: Optional[Path] = None) -> int:
+    """Compile all locale files and return the number of syntax errors found."""
+    json_files = sorted(messages_dir.glob('*.json'))
+
+    if not json_files:
+        print("No translation files found")
+        return 0
+
+    try:
+        variants = resolve_variants(messages_dir, reference_file, locale_graph)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"Compiling {len(json_files)} locale files...\n")
+
+    total_errors = 0
+    summary = []
+    manifest = {}
+    files_written = 0
+
+    for json_file in json_files:
+        locale = json_file.stem
+        data = variants[locale] if locale in variants else load_json_file(json_file)
+        if not data:
+            print(f"❌ {locale}: error loading file")
+            total_errors += 1
+            summary.append((locale, 'error'))
+            continue
+
+        compiled, errors = compile_catalog(data)
+
+        if errors:
+            total_errors += len(errors)
+            print(f"❌ {locale}: {len(errors)} syntax errors")
+            for key, message, offset in errors:
+                print(f"   - {locale} {key} (at {offset}): {message}")
+            summary.append((locale, 'invalid'))
+            continue
+
+        if check_only:
+            print(f"✅ {locale}: valid")
+            summary.append((locale, 'valid'))
+            continue
+
+        try:
+            entry, written = save_locale_artifacts(output_dir, locale, compiled, split_namespaces)
+        except Exception as e:
+            print(f"❌ {locale}: error saving compiled catalog: {e}")
+            total_errors += 1
+            summary.append((locale, 'error'))
+            continue
+
+        manifest[locale] = entry
+        files_written += written
+        if written:
+            print(f"🔄 {locale}: compiled -> {entry['file']}")
+        else:
+            print(f"✅ {locale}: unchanged ({entry['file']})")
+        summary.append((locale, 'compiled'))
+
+    # The manifest is only replaced when every locale compiled, so a broken
+    # message never leaves the app pointing at a partial build
+    manifest_updated = False
+    removed = []
+    if not check_only and not total_errors:
+        manifest_content = (json.dumps(manifest, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+        manifest_updated = write_if_changed(output_dir / MANIFEST_FILE, manifest_content)
+        if not keep_stale:
+            removed = remove_stale_artifacts(output_dir, manifest)
+
+    print()
+    print("=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+
+    if check_only:
+        print("🔍 CHECK ONLY MODE - No files were written\n")
+
+    valid = sum(1 for _, status in summary if status in ('valid', 'compiled'))
+    print(f"✅ Valid locales: {valid}/{len(summary)}")
+    print(f"❌ Syntax errors: {total_errors}")
+
+    if not check_only and valid:
+        print(f"🔄 Files written: {files_written}")
+        if removed:
+            print(f"🗑️  Stale files removed: {len(removed)}")
+        if total_errors:
+            print(f"⚠️  {MANIFEST_FILE} not updated because of errors")
+        else:
+            print(f"📁 Manifest: {output_dir / MANIFEST_FILE} ({'updated' if manifest_updated else 'unchanged'})")
+
+    return total_errors
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
+    parser.add_argument(
+        '--messages-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'messages',
+        help='Directory containing message files (default: ../messages)'
+    )
+    parser.add_argument(
+        '--output-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'build' / 'messages',
+        help='Directory for compiled catalogs (default: ../build/messages)'
+    )
+    parser.add_argument(
+        '--reference',
+        default='en-US.json',
+        help='Reference file (default: en-US.json)'
+    )
+    parser.add_argument(
+        '--locale-graph',
+        type=Path,
+        default=Path(__file__).parent.parent / 'locale-graph.json',
+        help='Locale inheritance graph used to resolve variants (default: ../locale-graph.json, optional)'
+    )
+    parser.add_argument(
+        '--check-only',
+        action='store_true',
+        help='Only validate message syntax without writing compiled catalogs'
+    )
+    parser.add_argument(
+        '--split-namespaces',
+        action='store_true',
+        help='Also write one hashed file per top-level namespace'
+    )
+    parser.add_argument(
+        '--keep-stale',
+        action='store_true',
+        help='Keep hashed files from previous builds that are no longer referenced'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
+    if not args.messages_dir.exists():
+        print(f"Directory not found: {args.messages_dir}")
+        return 1
+
+    errors = compile_messages(
+        messages_dir=args.messages_dir,
+        output_dir=args.output_dir,
+        check_only=args.check_only,
+        split_namespaces=args.split_namespaces,
+        keep_stale=args.keep_stale,
+        reference_file=args.reference,
+        locale_graph=args.locale_graph
+    )
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Precompile ICU messages and validate their syntax'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    exit(main())
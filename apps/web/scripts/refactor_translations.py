@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Script to rename or move translation keys in bulk.
+Applies a batch of key mappings (including whole namespaces) to every locale
+catalog and rewrites the matching t("...") calls in the web app sources.
+"""
+
+import difflib
+import json
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Optional
+import argparse
+
+
+# Matches t("key") and t('key') calls; the key is looked up in the mapping
+# table, so a single pattern serves every mapping in the batch
+T_CALL_PATTERN = re.compile(r'''(\bt\(\s*)(["'])([A-Za-z0-9_.\-]+)\2''')
+
+# Matches the static prefix of template literal keys such as t(`users.${mode}`)
+DYNAMIC_T_CALL_PATTERN = re.compile(r'\bt\(\s*`([^`$]*)\$\{')
+
+# Matches translators scoped to a namespace, such as useTranslations("auth")
+# or getTranslations({ namespace: "auth" }); their t() calls use keys
+# relative to the namespace, which T_CALL_PATTERN cannot remap
+NAMESPACED_T_PATTERN = re.compile(
+    r'''\b(?:useTranslations|getTranslations)\(\s*(?:\{\s*namespace\s*:\s*)?(["'])([A-Za-z0-9_.\-]+)\1'''
+)
+
+SOURCE_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx'}
+
+
+def load_json_file(file_path: Path) -> Dict[str, Any]:
+    """Load a JSON file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return {}
+
+
+def format_json(data: Dict[str, Any], indent: int = 2) -> str:
+    """Serialize a catalog with the same formatting as the other scripts."""
+    return json.dumps(data, ensure_ascii=False, indent=indent, separators=(',', ': ')) + '\n'
+
+
+def write_atomic(file_path: Path, content: str) -> None:
+    """Write a file through a temporary file so readers never see partial content."""
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f'.{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        if file_path.exists():
+            shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_mappings(pairs: List[str], mapping_file: Optional[Path]) -> Dict[str, str]:
+    """Collect key mappings from --map arguments and an optional JSON file."""
+    mappings = {}
+
+    if mapping_file:
+        data = load_json_file(mapping_file)
+        if not isinstance(data, dict):
+            raise ValueError(f"Mapping file must contain an object: {mapping_file}")
+        mappings.update(data)
+
+    for pair in pairs:
+        if '=' not in pair:
+            raise ValueError(f"Invalid mapping '{pair}', expected old.key=new.key")
+        old, new = pair.split('=', 1)
+        mappings[old.strip()] = new.strip()
+
+    for old, new in mappings.items():
+        if not isinstance(old, str) or not isinstance(new, str):
+            raise ValueError(f"Invalid mapping {old!r} -> {new!r}, old and new keys must be strings")
+        if not old or not new:
+            raise ValueError(f"Invalid mapping '{old}' -> '{new}'")
+        if new == old or new.startswith(old + '.'):
+            raise ValueError(f"Cannot move '{old}' into itself ('{new}')")
+
+    return mappings
+
+
+def remap_key(key: str, mappings: Dict[str, str]) -> str:
+    """Return the new name of a key; the longest matching prefix mapping wins."""
+    parts = key.split('.')
+
+    for i in range(len(parts), 0, -1):
+        prefix = '.'.join(parts[:i])
+        if prefix in mappings:
+            return '.'.join([mappings[prefix]] + parts[i:])
+
+    return key
+
+
+def flatten_catalog(data: Dict[str, Any], prefix: str = '') -> List[Tuple[str, Any]]:
+    """Flatten a nested catalog into (key, value) pairs, keeping file order."""
+    items = []
+
+    for key, value in data.items():
+        current_key = f"{prefix}.{key}" if prefix else key
+
+        if isinstance(value, dict) and value:
+            items.extend(flatten_catalog(value, current_key))
+        else:
+            items.append((current_key, value))
+
+    return items
+
+
+def refactor_catalog(data: Dict[str, Any], mappings: Dict[str, str]) -> Tuple[Dict[str, Any], int, List[str]]:
+    """Rebuild a catalog with all mappings applied in a single traversal."""
+    updated = {}
+    moved = 0
+    conflicts = []
+
+    for key, value in flatten_catalog(data):
+        new_key = remap_key(key, mappings)
+        if new_key != key:
+            moved += 1
+
+        parts = new_key.split('.')
+        current = updated
+        for part in parts[:-1]:
+            if part not in current:
+                current[part] = {}
+            elif not isinstance(current[part], dict):
+                break
+            current = current[part]
+        else:
+            if parts[-1] in current:
+                conflicts.append(f"{key} -> {new_key}: key already exists")
+            else:
+                current[parts[-1]] = value
+            continue
+
+        conflicts.append(f"{key} -> {new_key}: '{'.'.join(parts[:-1])}' is not a namespace")
+
+    return updated, moved, conflicts
+
+
+def refactor_source_file(task: Tuple[Path, Dict[str, str]]) -> Tuple[Path, str, str, int, List[str]]:
+    """Rewrite the t("...") keys of one source file.
+
+    Returns the original and updated content, the number of rewritten calls
+    and warnings for dynamic keys and namespaced translators that may point
+    into a moved namespace.
+    """
+    file_path, mappings = task
+    with open(file_path, 'r', encoding='utf-8') as f:
+        original = f.read()
+
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        new_key = remap_key(match.group(3), mappings)
+        if new_key == match.group(3):
+            return match.group(0)
+        count += 1
+        return f"{match.group(1)}{match.group(2)}{new_key}{match.group(2)}"
+
+    updated = T_CALL_PATTERN.sub(replace, original)
+
+    warnings = []
+    for match in DYNAMIC_T_CALL_PATTERN.finditer(original):
+        static = match.group(1)
+        if any(old.startswith(static) or static.startswith(old + '.') for old in mappings):
+            line = original.count('\n', 0, match.start()) + 1
+            warnings.append(f"{file_path}:{line}: dynamic key `{static}${{...}}` needs manual review")
+
+    for match in NAMESPACED_T_PATTERN.finditer(original):
+        namespace = match.group(2)
+        if any(old == namespace or old.startswith(namespace + '.') or namespace.startswith(old + '.')
+               for old in mappings):
+            line = original.count('\n', 0, match.start()) + 1
+            warnings.append(f"{file_path}:{line}: t() calls scoped to \"{namespace}\" are not rewritten "
+                            "and need manual review")
+
+    return file_path, original, updated, count, warnings
+
+
+def print_diff(file_path: Path, original: str, updated: str) -> None:
+    """Print a unified diff between two versions of a file."""
+    name = os.path.relpath(file_path)
+    diff = difflib.unified_diff(
+        original.splitlines(keepends=True),
+        updated.splitlines(keepends=True),
+        fromfile=f"a/{name}",
+        tofile=f"b/{name}"
+    )
+    print(''.join(diff), end='')
+
+
+def refactor_translations(messages_dir: Path, src_dir: Path, mappings: Dict[str, str],
+                          reference_file: str = 'en-US.json', dry_run: bool = False,
+                          jobs: Optional[int] = None) -> int:
+    """Apply key mappings to all catalogs and sources; return the number of errors."""
+    json_files = sorted(messages_dir.glob('*.json'))
+    if not json_files:
+        print("No translation files found")
+        return 1
+
+    reference_keys = {key for key, _ in flatten_catalog(load_json_file(messages_dir / reference_file))}
+    for old in sorted(mappings):
+        if old not in reference_keys and not any(key.startswith(old + '.') for key in reference_keys):
+            print(f"⚠️  '{old}' not found in {reference_file}")
+
+    print(f"Applying {len(mappings)} key mappings to {len(json_files)} catalogs...\n")
+
+    # Plan every catalog change first so conflicts abort before anything is written
+    catalog_changes = []
+    errors = 0
+
+    for json_file in json_files:
+        data = load_json_file(json_file)
+        if not data:
+            print(f"  ❌ Error loading {json_file.name}")
+            errors += 1
+            continue
+
+        updated, moved, conflicts = refactor_catalog(data, mappings)
+        if conflicts:
+            errors += len(conflicts)
+            print(f"  ❌ {json_file.name}: {len(conflicts)} conflicts")
+            for conflict in conflicts[:10]:
+                print(f"    - {conflict}")
+            if len(conflicts) > 10:
+                print(f"    ... and {len(conflicts) - 10} more")
+            continue
+
+        print(f"  🔍 {json_file.name}: {moved} keys moved")
+        if moved:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                catalog_changes.append((json_file, f.read(), format_json(updated)))
+
+    source_files = sorted(
+        p for p in src_dir.rglob('*')
+        if p.suffix in SOURCE_EXTENSIONS and 'node_modules' not in p.parts
+    )
+    print(f"\nScanning {len(source_files)} source files...")
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(refactor_source_file,
+                                    [(p, mappings) for p in source_files],
+                                    chunksize=16))
+
+    source_changes = [(path, original, updated) for path, original, updated, count, _ in results if count]
+    calls = sum(count for _, _, _, count, _ in results)
+    warnings = [warning for *_, file_warnings in results for warning in file_warnings]
+
+    print(f"  🔍 {calls} t() calls to rewrite in {len(source_changes)} files")
+    for warning in warnings:
+        print(f"  ⚠️  {warning}")
+    print()
+
+    if errors:
+        print(f"❌ {errors} errors found, no files were changed")
+        return errors
+
+    if dry_run:
+        for path, original, updated in catalog_changes + source_changes:
+            print_diff(path, original, updated)
+    else:
+        for path, _, updated in catalog_changes + source_changes:
+            try:
+                write_atomic(path, updated)
+            except Exception as e:
+                print(f"  ❌ Error saving {path}: {e}")
+                errors += 1
+
+    print("=" * 60)
+    print("SUMMARY")
+    print("=" * 60)
+
+    if dry_run:
+        print("🔍 DRY RUN MODE - No changes were made\n")
+
+    print(f"🔄 Catalogs updated: {len(catalog_changes)}")
+    print(f"🔄 Source files updated: {len(source_changes)} ({calls} t() calls)")
+    if warnings:
+        print(f"⚠️  Call sites to review: {len(warnings)}")
+
+    return errors
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
+    parser.add_argument(
+        '--messages-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'messages',
+        help='Directory containing message files (default: ../messages)'
+    )
+    parser.add_argument(
+        '--src-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'src',
+        help='Directory containing the web app sources (default: ../src)'
+    )
+    parser.add_argument(
+        '--reference',
+        default='en-US.json',
+        help='Reference file used to validate mappings (default: en-US.json)'
+    )
+    parser.add_argument(
+        '--map',
+        action='append',
+        default=[],
+        metavar='OLD=NEW',
+        help='Key or namespace mapping, e.g. reverseShares.modals=reverseShareModals (repeatable)'
+    )
+    parser.add_argument(
+        '--mapping-file',
+        type=Path,
+        help='JSON file with an object of old key to new key mappings'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes for source files (default: CPU count)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Only show a diff of what would be changed without making modifications'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
+    if not args.messages_dir.exists():
+        print(f"Directory not found: {args.messages_dir}")
+        return 1
+
+    if not args.src_dir.exists():
+        print(f"Directory not found: {args.src_dir}")
+        return 1
+
+    try:
+        mappings = load_mappings(args.map, args.mapping_file)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not mappings:
+        print("No mappings given, use --map OLD=NEW or --mapping-file")
+        return 1
+
+    errors = refactor_translations(
+        messages_dir=args.messages_dir,
+        src_dir=args.src_dir,
+        mappings=mappings,
+        reference_file=args.reference,
+        dry_run=args.dry_run,
+        jobs=args.jobs
+    )
+
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Rename or move translation keys across all catalogs and sources'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -2,171 +2,244 @@
 """
 Main script to run Palmr translation management operations.
 Makes it easy to run scripts without remembering specific names.
+Each command is implemented by a script that registers its own arguments
+through add_arguments(parser) and runs through run(args); the script is
+only imported when its command is used, so startup stays fast.
 """
 
-import sys
-import subprocess
-from pathlib import Path
+import importlib
 import argparse
 
 
-def run_command(script_name: str, args: list) -> int:
-    """Execute a script with the provided arguments."""
-    script_path = Path(__file__).parent / script_name
-    cmd = [sys.executable, str(script_path)] + args
-    return subprocess.run(cmd).returncode
+# Command name -> script module, help text, banner and optional entry points
+# (defaults: add_arguments and run). New scripts only need an entry here.
+COMMANDS = {
+    'check': {
+        'module': 'check_translations',
+        'help': 'Check translation status',
+        'banner': '🔍 Checking translation status...'
+    },
+    'sync': {
+        'module': 'sync_translations',
+        'help': 'Synchronize missing keys',
+        'banner': '🔄 Synchronizing translation keys...'
+    },
+    'clean': {
+        'module': 'clean_translations',
+        'help': 'Remove duplicated [TO_TRANSLATE] prefixes',
+        'banner': '🧹 Cleaning translation prefixes...'
+    },
+    'suggest': {
+        'module': 'suggest_translations',
+        'help': 'Suggest translations from similar strings',
+        'banner': '💡 Looking up translation suggestions...'
+    },
+    'glossary': {
+        'module': 'check_glossary',
+        'help': 'Check consistent translation of glossary terms',
+        'banner': '📖 Checking glossary terms...'
+    },
+    'compile': {
+        'module': 'compile_messages',
+        'help': 'Validate and precompile ICU messages',
+        'banner': '🧩 Compiling ICU messages...'
+    },
+    'refactor': {
+        'module': 'refactor_translations',
+        'help': 'Rename or move keys in catalogs and sources',
+        'banner': '🔀 Refactoring translation keys...'
+    },
+    'merge-reports': {
+        'module': 'check_translations',
+        'help': 'Combine sharded check results into one report',
+        'banner': '🧮 Merging sharded translation reports...',
+        'add_arguments': 'add_merge_arguments',
+        'run': 'run_merge'
+    },
+    'benchmark': {
+        'module': 'benchmark_startup',
+        'help': 'Measure the startup time of the commands',
+        'banner': '⏱️  Measuring command startup time...'
+    }
+}
 
 
-def filter_args_for_script(script_name: str, args: list) -> list:
-    """Filter arguments based on what each script accepts."""
-    
-    # Arguments that check_translations.py accepts
-    check_args = ['--messages-dir', '--reference']
-    
-    # Arguments that sync_translations.py accepts  
-    sync_args = ['--messages-dir', '--reference', '--no-mark-untranslated', '--dry-run']
-    
-    if script_name == 'check_translations.py':
-        filtered = []
-        skip_next = False
-        for i, arg in enumerate(args):
-            if skip_next:
-                skip_next = False
-                continue
-            if arg in check_args:
-                filtered.append(arg)
-                # Add the value for the argument if it exists
-                if i + 1 < len(args) and not args[i + 1].startswith('--'):
-                    filtered.append(args[i + 1])
-                    skip_next = True
-        return filtered
-    
-    elif script_name == 'sync_translations.py':
-        filtered = []
-        skip_next = False
-        for i, arg in enumerate(args):
-            if skip_next:
-                skip_next = False
-                continue
-            if arg in sync_args:
-                filtered.append(arg)
-                # Add the value for the argument if it exists
-                if i + 1 < len(args) and not args[i + 1].startswith('--'):
-                    filtered.append(args[i + 1])
-                    skip_next = True
-        return filtered
-    
-    return args
+def load_command(name: str, prog: str, argv: list):
+    """Import the script of a command and parse its arguments.
+    
+    Unknown arguments are reported by the command's own parser instead of
+    being ignored.
+    """
+    command = COMMANDS[name]
+    module = importlib.import_module(command['module'])
+    
+    parser = argparse.ArgumentParser(prog=f"{prog} {name}", description=command['help'])
+    getattr(module, command.get('add_arguments', 'add_arguments'))(parser)
+    
+    return getattr(module, command.get('run', 'run')), parser.parse_args(argv)
 
 
-def main():
+def run_all(prog: str, argv: list) -> int:
+    """Run the complete workflow: check, sync and check again."""
+    check = importlib.import_module('check_translations')
+    sync = importlib.import_module('sync_translations')
+    
+    # Both scripts define --messages-dir, --reference, etc. with the same
+    # defaults, so the later definition simply replaces the earlier one
+    parser = argparse.ArgumentParser(
+        prog=f"{prog} all",
+        description='Run complete workflow (check + sync + check)',
+        conflict_handler='resolve'
+    )
+    check.add_arguments(parser)
+    sync.add_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    print("⚡ Running complete translation workflow...")
+    print()
+    
+    # 1. Initial check
+    print("1️⃣ Checking initial status...")
+    result = check.run(args)
+    if result != 0:
+        print("❌ Error in initial check")
+        return result
+    
+    print("\n" + "="*50)
+    
+    # 2. Sync
+    print("2️⃣ Synchronizing missing keys...")
+    result = sync.run(args)
+    if result != 0:
+        print("❌ Error in synchronization")
+        return result
+    
+    print("\n" + "="*50)
+    
+    # 3. Final check
+    print("3️⃣ Final check...")
+    result = check.run(args)
+    if result != 0:
+        print("❌ Error in final check")
+        return result
+    
+    print("\n🎉 Complete workflow executed successfully!")
+    if args.dry_run:
+        print("💡 Run without --dry-run to apply changes")
+    else:
+        print("💡 Review strings marked with [TO_TRANSLATE] and translate them manually")
+    
+    return 0
+
+
+def print_help() -> None:
+    """Show detailed help for all commands."""
+    print("🌍 PALMR TRANSLATION MANAGER")
+    print("=" * 50)
+    print()
+    print("📋 AVAILABLE COMMANDS:")
+    print()
+    print("🔍 check - Check translation status")
+    print("   python3 run_translations.py check")
+    print("   python3 run_translations.py check --reference pt-BR.json")
+    print()
+    print("🔄 sync - Synchronize missing keys")
+    print("   python3 run_translations.py sync")
+    print("   python3 run_translations.py sync --dry-run")
+    print("   python3 run_translations.py sync --no-mark-untranslated")
+    print("   python3 run_translations.py sync --prune")
+    print()
+    print("🧹 clean - Remove duplicated [TO_TRANSLATE] prefixes")
+    print("   python3 run_translations.py clean")
+    print("   python3 run_translations.py clean --dry-run")
+    print()
+    print("💡 suggest - Suggest translations from similar translated strings")
+    print("   python3 run_translations.py suggest")
+    print("   python3 run_translations.py suggest --top-k 5 --min-score 0.6")
+    print("   python3 run_translations.py suggest --json suggestions.json")
+    print()
+    print("📖 glossary - Check consistent translation of glossary terms")
+    print("   python3 run_translations.py glossary")
+    print("   python3 run_translations.py glossary --glossary-dir ../glossary")
+    print()
+    print("🧩 compile - Validate and precompile ICU messages")
+    print("   python3 run_translations.py compile")
+    print("   python3 run_translations.py compile --check-only")
+    print("   python3 run_translations.py compile --output-dir ../build/messages")
+    print()
+    print("🔀 refactor - Rename or move keys in catalogs and sources")
+    print("   python3 run_translations.py refactor --map reverseShares.modals=reverseShareModals --dry-run")
+    print("   python3 run_translations.py refactor --mapping-file moves.json")
+    print()
+    print("🧮 merge-reports - Combine sharded check results")
+    print("   python3 run_translations.py check --shard 1/4 --json-output shard-1.json")
+    print("   python3 run_translations.py merge-reports shard-1.json shard-2.json shard-3.json shard-4.json")
+    print()
+    print("⏱️  benchmark - Measure the startup time of the commands")
+    print("   python3 run_translations.py benchmark")
+    print("   python3 run_translations.py benchmark --runs 20 --commands check sync")
+    print()
+    print("⚡ all - Complete workflow (sync + check)")
+    print("   python3 run_translations.py all")
+    print("   python3 run_translations.py all --dry-run")
+    print()
+    print("📁 STRUCTURE:")
+    print("   apps/web/scripts/    - Management scripts")
+    print("   apps/web/messages/   - Translation files")
+    print()
+    print("💡 TIPS:")
+    print("• Use --dry-run on sync, clean or all commands to test")
+    print("• Use --help on any command for specific options")
+    print("• Use --shard I/N on check, sync or all to split work across CI jobs")
+    print("• Manually translate strings marked with [TO_TRANSLATE]")
+    print("• Read documentation for complete translation guidelines")
+
+
+def main(argv=None) -> int:
     parser = argparse.ArgumentParser(
         description='Main script to manage Palmr translations',
         epilog='Examples:\n'
                '  python3 run_translations.py check\n'
                '  python3 run_translations.py sync --dry-run\n'
-               '  python3 run_translations.py all --dry-run\n',
+               '  python3 run_translations.py all --dry-run\n'
+               '  python3 run_translations.py clean --dry-run\n'
+               '  python3 run_translations.py check --shard 1/4 --json-output shard-1.json\n'
+               '  python3 run_translations.py merge-reports shard-*.json\n'
+               '  python3 run_translations.py compile --check-only\n'
+               '  python3 run_translations.py suggest --json suggestions.json\n'
+               '  python3 run_translations.py glossary\n'
+               '  python3 run_translations.py refactor --map old.key=new.key --dry-run\n'
+               '  python3 run_translations.py check --help\n',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
     parser.add_argument(
         'command',
-        choices=['check', 'sync', 'all', 'help'],
-        help='Command to execute:\n'
-             'check - Check translation status\n'
-             'sync - Synchronize missing keys\n' 
+        choices=list(COMMANDS) + ['all', 'help'],
+        help='Command to execute:\n' +
+             ''.join(f"{name} - {command['help']}\n" for name, command in COMMANDS.items()) +
              'all - Run complete workflow (sync + check)\n'
              'help - Show detailed help'
     )
+    parser.add_argument(
+        'args',
+        nargs=argparse.REMAINDER,
+        help='Arguments for the command (see <command> --help)'
+    )
     
-    # Capture remaining arguments to pass to scripts
-    args, remaining_args = parser.parse_known_args()
+    args = parser.parse_args(argv)
     
     if args.command == 'help':
-        print("🌍 PALMR TRANSLATION MANAGER")
-        print("=" * 50)
-        print()
-        print("📋 AVAILABLE COMMANDS:")
-        print()
-        print("🔍 check - Check translation status")
-        print("   python3 run_translations.py check")
-        print("   python3 run_translations.py check --reference pt-BR.json")
-        print()
-        print("🔄 sync - Synchronize missing keys")
-        print("   python3 run_translations.py sync")
-        print("   python3 run_translations.py sync --dry-run")
-        print("   python3 run_translations.py sync --no-mark-untranslated")
-        print()
-        print("⚡ all - Complete workflow (sync + check)")
-        print("   python3 run_translations.py all")
-        print("   python3 run_translations.py all --dry-run")
-        print()
-        print("📁 STRUCTURE:")
-        print("   apps/web/scripts/    - Management scripts")
-        print("   apps/web/messages/   - Translation files")
-        print()
-        print("💡 TIPS:")
-        print("• Use --dry-run on sync or all commands to test")
-        print("• Use --help on any command for specific options")
-        print("• Manually translate strings marked with [TO_TRANSLATE]")
-        print("• Read documentation for complete translation guidelines")
+        print_help()
         return 0
     
-    elif args.command == 'check':
-        print("🔍 Checking translation status...")
-        filtered_args = filter_args_for_script('check_translations.py', remaining_args)
-        return run_command('check_translations.py', filtered_args)
-    
-    elif args.command == 'sync':
-        print("🔄 Synchronizing translation keys...")
-        filtered_args = filter_args_for_script('sync_translations.py', remaining_args)
-        return run_command('sync_translations.py', filtered_args)
-    
-    elif args.command == 'all':
-        print("⚡ Running complete translation workflow...")
-        print()
-        
-        # Determine if it's dry-run based on arguments
-        is_dry_run = '--dry-run' in remaining_args
-        
-        # 1. Initial check
-        print("1️⃣ Checking initial status...")
-        check_args = filter_args_for_script('check_translations.py', remaining_args)
-        result = run_command('check_translations.py', check_args)
-        if result != 0:
-            print("❌ Error in initial check")
-            return result
-        
-        print("\n" + "="*50)
-        
-        # 2. Sync
-        print("2️⃣ Synchronizing missing keys...")
-        sync_args = filter_args_for_script('sync_translations.py', remaining_args)
-        result = run_command('sync_translations.py', sync_args)
-        if result != 0:
-            print("❌ Error in synchronization")
-            return result
-        
-        print("\n" + "="*50)
-        
-        # 3. Final check
-        print("3️⃣ Final check...")
-        check_args = filter_args_for_script('check_translations.py', remaining_args)
-        result = run_command('check_translations.py', check_args)
-        if result != 0:
-            print("❌ Error in final check")
-            return result
-        
-        print("\n🎉 Complete workflow executed successfully!")
-        if is_dry_run:
-            print("💡 Run without --dry-run to apply changes")
-        else:
-            print("💡 Review strings marked with [TO_TRANSLATE] and translate them manually")
-        
-        return 0
+    if args.command == 'all':
+        return run_all(parser.prog, args.args)
     
-    return 0
+    run, command_args = load_command(args.command, parser.prog, args.args)
+    print(COMMANDS[args.command]['banner'])
+    return run(command_args)
 
 
 if __name__ == '__main__':
-    exit(main()) 
\ No newline at end of file
+    exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Script to suggest translations for new or untranslated keys.
+Builds a character n-gram index over the reference strings once and, for
+every key still marked [TO_TRANSLATE], looks up similar reference strings
+that are already translated in the same locale. Variants declared in the
+locale inheritance graph are resolved first, so inherited keys count as
+translated and can be suggested.
+"""
+
+import json
+import math
+from bisect import bisect_left
+from collections import defaultdict
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Optional, Set
+import argparse
+
+from sync_translations import load_locale_graph, topological_order, resolve_locales
+
+
+TO_TRANSLATE_PREFIX = '[TO_TRANSLATE]'
+
+
+def load_json_file(file_path: Path) -> Dict[str, Any]:
+    """Load a JSON file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return {}
+
+
+def get_all_string_values(data: Dict[str, Any], prefix: str = '') -> List[Tuple[str, str]]:
+    """Extract all strings from nested JSON with their keys."""
+    strings = []
+
+    for key, value in data.items():
+        current_key = f"{prefix}.{key}" if prefix else key
+
+        if isinstance(value, str):
+            strings.append((current_key, value))
+        elif isinstance(value, dict):
+            strings.extend(get_all_string_values(value, current_key))
+
+    return strings
+
+
+def get_ngrams(text: str, n: int = 3) -> Set[str]:
+    """Return the set of character n-grams of a normalized string."""
+    normalized = f" {' '.join(text.lower().split())} "
+    if len(normalized) <= n:
+        return {normalized}
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+class NGramIndex:
+    """Inverted index from character n-grams to the strings containing them.
+    
+    Posting lists are sorted by the n-gram count of each string and kept
+    next to a parallel list of those counts. A query applies two exact
+    filters derived from min_score, so common n-grams and strings of very
+    different length are not visited:
+    
+    - length filter: only strings whose n-gram count allows the minimum
+      score are read from a posting list, found by bisection;
+    - prefix filter: a match must share at least min_overlap n-grams with
+      the query, so it has to contain one of the query's rarest
+      len(grams) - min_overlap + 1 n-grams, and only those are probed.
+    
+    Candidates from the prefix are scored against their stored n-gram sets.
+    When min_score is low the prefix covers most of the query, and it is
+    cheaper to count shared n-grams over every length-filtered list instead.
+    """
+    
+    # Scoring a candidate by set intersection costs roughly this many
+    # posting entries read while counting
+    VERIFY_COST = 4
+    
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.postings = defaultdict(list)
+        self.sizes = {}
+        self.grams = {}
+        self.is_sorted = True
+    
+    def add(self, key: str, text: str) -> None:
+        grams = get_ngrams(text, self.n)
+        self.grams[key] = grams
+        for gram in grams:
+            self.postings[gram].append(key)
+        self.is_sorted = False
+    
+    def query(self, text: str, min_score: float = 0.5, exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Return (key, Dice similarity) pairs above min_score, best first."""
+        if not self.is_sorted:
+            for gram, posting in self.postings.items():
+                posting.sort(key=lambda key: (len(self.grams[key]), key))
+                self.sizes[gram] = [len(self.grams[key]) for key in posting]
+            self.is_sorted = True
+        
+        grams = get_ngrams(text, self.n)
+        size = len(grams)
+        
+        # Dice = 2 * shared / (size + other) >= p / q bounds both the other
+        # string's n-gram count and the number of shared n-grams. The bounds
+        # use integers only: in floats (2 - 0.8) * 8 / 0.8 is 11.999...,
+        # which would drop exact matches such as 12 n-grams at score 0.8
+        threshold = Fraction(str(min_score))
+        p, q = threshold.numerator, threshold.denominator
+        if p > q:
+            return []
+        if p > 0:
+            min_size = -(-p * size // (2 * q - p))
+            max_size = (2 * q - p) * size // p
+        else:
+            min_size, max_size = 0, math.inf
+        min_overlap = max(1, min_size)
+        
+        ranges = []
+        for gram in grams:
+            sizes = self.sizes.get(gram)
+            if not sizes:
+                continue
+            start = bisect_left(sizes, min_size)
+            stop = bisect_left(sizes, max_size + 1)
+            if stop > start:
+                ranges.append((stop - start, gram, start, stop))
+        
+        if len(ranges) < min_overlap:
+            return []
+        
+        ranges.sort()
+        prefix = ranges[:len(ranges) - min_overlap + 1]
+        
+        results = []
+        if sum(r[0] for r in ranges) <= self.VERIFY_COST * sum(r[0] for r in prefix):
+            shared = defaultdict(int)
+            for _, gram, start, stop in ranges:
+                for key in self.postings[gram][start:stop]:
+                    shared[key] += 1
+            candidates = shared.items()
+        else:
+            keys = set()
+            for _, gram, start, stop in prefix:
+                keys.update(self.postings[gram][start:stop])
+            candidates = ((key, len(grams & self.grams[key])) for key in keys)
+        
+        for key, count in candidates:
+            total = size + len(self.grams[key])
+            if 2 * count * q >= p * total and key != exclude:
+                results.append((key, 2 * count / total))
+        
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results
+
+
+def build_reference_index(reference_strings: Dict[str, str], n: int = 3) -> NGramIndex:
+    """Index every reference string once so all locales can share it."""
+    index = NGramIndex(n)
+    for key, text in reference_strings.items():
+        index.add(key, text)
+    return index
+
+
+def is_translated(value: Optional[str]) -> bool:
+    return value is not None and not value.startswith(TO_TRANSLATE_PREFIX)
+
+
+def suggest_for_locale(index: NGramIndex, reference_strings: Dict[str, str],
+                       locale_strings: Dict[str, str], candidates_cache: Dict[str, List[Tuple[str, float]]],
+                       top_k: int = 3, min_score: float = 0.5) -> Dict[str, List[Dict[str, Any]]]:
+    """Suggest existing translations for every untranslated key of a locale.
+
+    Index lookups depend only on the reference text, so they are cached
+    across locales and each locale only filters the ranked candidates.
+    """
+    suggestions = {}
+
+    for key, reference_text in reference_strings.items():
+        if is_translated(locale_strings.get(key)):
+            continue
+
+        if key not in candidates_cache:
+            candidates_cache[key] = index.query(reference_text, min_score, exclude=key)
+
+        matches = []
+        for candidate, score in candidates_cache[key]:
+            translation = locale_strings.get(candidate)
+            if not is_translated(translation):
+                continue
+            matches.append({
+                'key': candidate,
+                'score': round(score, 3),
+                'source': reference_strings[candidate],
+                'translation': translation
+            })
+            if len(matches) >= top_k:
+                break
+
+        if matches:
+            suggestions[key] = matches
+
+    return suggestions
+
+
+def generate_suggestions(messages_dir: Path, reference_file: str = 'en-US.json', top_k: int = 3,
+                         min_score: float = 0.5, json_output: Optional[Path] = None,
+                         locale_graph: Optional[Path] = None) -> int:
+    """Print translation suggestions for all locales and optionally save them as JSON.
+
+    Returns 1 if the reference file or the locale graph is invalid.
+    """
+    reference_path = messages_dir / reference_file
+    if not reference_path.exists():
+        print(f"Reference file not found: {reference_path}")
+        return 1
+
+    reference_data = load_json_file(reference_path)
+    reference_strings = dict(get_all_string_values(reference_data))
+    json_files = sorted(f for f in messages_dir.glob('*.json') if f.name != reference_file)
+    reference_locale = reference_path.stem
+
+    try:
+        parents = load_locale_graph(locale_graph, [f.stem for f in json_files], reference_locale)
+        order = topological_order(parents, reference_locale)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    resolved = resolve_locales(messages_dir, reference_locale, reference_data, parents, order)
+    index = build_reference_index(reference_strings)
+    candidates_cache = {}
+
+    print(f"💡 TRANSLATION SUGGESTIONS")
+    print(f"Reference: {reference_file} ({len(reference_strings)} strings indexed)")
+    print("=" * 80)
+
+    results = {}
+
+    for json_file in json_files:
+        locale = json_file.stem
+        locale_strings = dict(get_all_string_values(resolved.get(locale, {})))
+        untranslated = sum(1 for key in reference_strings if not is_translated(locale_strings.get(key)))
+
+        suggestions = suggest_for_locale(index, reference_strings, locale_strings,
+                                         candidates_cache, top_k, min_score)
+        results[locale] = suggestions
+
+        if not untranslated:
+            print(f"✅ {locale}: nothing to translate")
+            continue
+
+        print(f"🔍 {locale}: {len(suggestions)}/{untranslated} untranslated keys have suggestions")
+        for key, matches in list(suggestions.items())[:10]:
+            print(f"   • {key}: \"{reference_strings[key][:50]}\"")
+            for match in matches:
+                print(f"     - {match['score']:.2f} {match['key']}: \"{match['translation'][:50]}\"")
+        if len(suggestions) > 10:
+            print(f"   ... and {len(suggestions) - 10} more")
+
+    print("=" * 80)
+
+    if json_output:
+        try:
+            with open(json_output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+            print(f"📁 Suggestions saved to: {json_output}")
+        except Exception as e:
+            print(f"Error saving {json_output}: {e}")
+
+    return 0
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
+    parser.add_argument(
+        '--messages-dir',
+        type=Path,
+        default=Path(__file__).parent.parent / 'messages',
+        help='Directory containing message files (default: ../messages)'
+    )
+    parser.add_argument(
+        '--reference',
+        default='en-US.json',
+        help='Reference file (default: en-US.json)'
+    )
+    parser.add_argument(
+        '--locale-graph',
+        type=Path,
+        default=Path(__file__).parent.parent / 'locale-graph.json',
+        help='Locale inheritance graph (default: ../locale-graph.json, optional)'
+    )
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=3,
+        help='Maximum number of suggestions per key (default: 3)'
+    )
+    parser.add_argument(
+        '--min-score',
+        type=float,
+        default=0.5,
+        help='Minimum similarity between 0 and 1 (default: 0.5)'
+    )
+    parser.add_argument(
+        '--json',
+        type=Path,
+        dest='json_output',
+        help='Write all suggestions to this JSON file'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
+    if not args.messages_dir.exists():
+        print(f"Directory not found: {args.messages_dir}")
+        return 1
+
+    return generate_suggestions(
+        messages_dir=args.messages_dir,
+        reference_file=args.reference,
+        top_k=args.top_k,
+        min_score=args.min_score,
+        json_output=args.json_output,
+        locale_graph=args.locale_graph
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Suggest translations for untranslated keys from similar translated strings'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """
 Script to synchronize translations using en-US.json as reference.
-Adds missing keys to other language files.
+Adds missing keys to other language files. Regional variants and overlays
+declared in the locale inheritance graph are kept sparse: they only hold
+their own overrides and inherit every other key from their parent.
 """
 
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, Set, List
+from typing import Dict, Any, Set, List, Optional, Tuple
 import argparse
 
 
@@ -21,6 +24,26 @@ def load_json_file(file_path: Path) -> Dict[str, Any]:
         return {}
 
 
+def load_locale_file(file_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a locale file, returning None if it cannot be used.
+    
+    Unlike load_json_file, an empty object is valid here: a sparse variant
+    that overrides nothing is empty, so errors must be told apart from it.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"Error loading {file_path}: {e}")
+        return None
+    
+    if not isinstance(data, dict):
+        print(f"Error loading {file_path}: expected a JSON object")
+        return None
+    
+    return data
+
+
 def save_json_file(file_path: Path, data: Dict[str, Any], indent: int = 2) -> bool:
     """Save a JSON file with consistent formatting."""
     try:
@@ -87,112 +110,456 @@ def find_missing_keys(reference_data: Dict[str, Any], target_data: Dict[str, Any
     return sorted(list(missing_keys))
 
 
-def add_missing_keys(reference_data: Dict[str, Any], target_data: Dict[str, Any], 
-                    missing_keys: List[str], mark_as_untranslated: bool = True) -> Dict[str, Any]:
-    """Add missing keys to target_data using reference values."""
-    updated_data = target_data.copy()
+def untranslated_copy(reference_value: Any, mark_as_untranslated: bool) -> Any:
+    """Copy a reference value, marking its strings as [TO_TRANSLATE] if requested."""
+    if isinstance(reference_value, dict):
+        return {k: untranslated_copy(v, mark_as_untranslated) for k, v in reference_value.items()}
+    if mark_as_untranslated and isinstance(reference_value, str):
+        return f"[TO_TRANSLATE] {reference_value}"
+    return copy.deepcopy(reference_value)
+
+
+def get_leaf_keys(value: Any, prefix: str) -> List[str]:
+    """List the keys of all leaves below a value, or the value's own key."""
+    if isinstance(value, dict) and value:
+        keys = []
+        for key, child in value.items():
+            keys.extend(get_leaf_keys(child, f"{prefix}.{key}"))
+        return keys
+    return [prefix]
+
+
+def merge_missing_keys(reference_data: Dict[str, Any], target_data: Dict[str, Any],
+                       mark_as_untranslated: bool = True, prune: bool = False,
+                       prefix: str = '') -> Tuple[Dict[str, Any], List[str]]:
+    """Merge reference keys into target_data in a single pass.
+    
+    Keys missing from the target are added after its existing keys. With
+    prune, keys that no longer exist in the reference are dropped together
+    with any namespace left empty. Neither input is modified, so cached
+    parent trees can be shared safely.
     
-    for key_path in missing_keys:
-        reference_value = get_nested_value(reference_data, key_path)
+    Returns the merged data and the list of pruned keys.
+    """
+    merged = {}
+    pruned = []
+    
+    for key, value in target_data.items():
+        current_key = f"{prefix}.{key}" if prefix else key
         
-        if reference_value is not None:
-            # Check if the key already exists in target with a [TO_TRANSLATE] prefix
-            existing_value = get_nested_value(target_data, key_path)
-            
-            if mark_as_untranslated and isinstance(reference_value, str):
-                # If the existing value already starts with [TO_TRANSLATE], don't add another prefix
-                if existing_value and isinstance(existing_value, str) and existing_value.startswith("[TO_TRANSLATE]"):
-                    translated_value = existing_value
-                else:
-                    translated_value = f"[TO_TRANSLATE] {reference_value}"
+        if key not in reference_data:
+            if prune:
+                pruned.extend(get_leaf_keys(value, current_key))
             else:
-                translated_value = reference_value
-            
-            set_nested_value(updated_data, key_path, translated_value)
+                merged[key] = copy.deepcopy(value)
+            continue
+        
+        reference_value = reference_data[key]
+        
+        if isinstance(reference_value, dict) and isinstance(value, dict):
+            merged[key], nested_pruned = merge_missing_keys(
+                reference_value, value, mark_as_untranslated, prune, current_key)
+            pruned.extend(nested_pruned)
+        elif isinstance(reference_value, dict):
+            # The reference turned this string into a namespace
+            merged[key] = untranslated_copy(reference_value, mark_as_untranslated)
+        elif isinstance(value, dict) and prune:
+            # The reference turned this namespace into a string
+            pruned.extend(get_leaf_keys(value, current_key))
+            merged[key] = untranslated_copy(reference_value, mark_as_untranslated)
+        else:
+            merged[key] = copy.deepcopy(value)
+    
+    for key, reference_value in reference_data.items():
+        if key not in merged and key not in target_data:
+            merged[key] = untranslated_copy(reference_value, mark_as_untranslated)
+    
+    return merged, pruned
+
+
+def split_overlay(reference_data: Dict[str, Any], overlay: Dict[str, Any],
+                  parent_data: Optional[Dict[str, Any]] = None,
+                  prefix: str = '') -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """Split a locale's own keys into valid overrides, orphans and parent copies.
+    
+    Orphans are keys that do not exist in the reference (or have a different
+    shape there). When parent_data is given, values identical to the
+    parent's are reported as copies instead of overrides. Returns the
+    overrides, which keep the overlay's key order, and both key lists.
+    """
+    kept = {}
+    orphans = []
+    copies = []
+    
+    for key, value in overlay.items():
+        current_key = f"{prefix}.{key}" if prefix else key
+        reference_value = reference_data.get(key)
+        parent_value = parent_data.get(key) if isinstance(parent_data, dict) else None
+        
+        if key not in reference_data or isinstance(value, dict) != isinstance(reference_value, dict):
+            orphans.extend(get_leaf_keys(value, current_key))
+        elif isinstance(value, dict):
+            nested, nested_orphans, nested_copies = split_overlay(
+                reference_value, value, parent_value, current_key)
+            if nested:
+                kept[key] = nested
+            orphans.extend(nested_orphans)
+            copies.extend(nested_copies)
+        elif parent_data is not None and value == parent_value:
+            copies.append(current_key)
+        else:
+            kept[key] = value
+    
+    return kept, orphans, copies
+
+
+def merge_trees(parent: Dict[str, Any], child: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay a child catalog on its parent's resolved tree."""
+    merged = dict(parent)
+    
+    for key, value in child.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_trees(merged[key], value)
+        else:
+            merged[key] = value
+    
+    return merged
+
+
+def resolve_locale(reference_data: Dict[str, Any], parent_resolved: Dict[str, Any],
+                   own_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve a locale from its parent's resolved tree and its own keys.
+    
+    Keys that are not in the reference are left out, so orphans of a
+    parent never reach its children.
+    """
+    return merge_trees(parent_resolved, split_overlay(reference_data, own_data)[0])
+
+
+def resolve_locales(messages_dir: Path, reference_locale: str, reference_data: Dict[str, Any],
+                    parents: Dict[str, str], order: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Resolve every locale of a topological order against its parent chain.
+    
+    Locales that cannot be loaded, or whose parent cannot, are left out.
+    """
+    # Resolved trees hold translated keys only; nothing falls back to the reference
+    resolved = {reference_locale: {}}
     
-    return updated_data
+    for locale in order:
+        parent = parents[locale]
+        own_data = load_locale_file(messages_dir / f"{locale}.json")
+        if parent in resolved and own_data is not None:
+            resolved[locale] = resolve_locale(reference_data, resolved[parent], own_data)
+        elif own_data is not None:
+            print(f"Error resolving {locale}: parent {parent} could not be loaded")
+    
+    return resolved
+
+
+def load_locale_graph(graph_path: Optional[Path], locales: List[str], reference_locale: str) -> Dict[str, str]:
+    """Map every locale to its parent, defaulting to the reference locale.
+
+    The graph file declares only the locales that do not inherit directly
+    from the reference, e.g. {"parents": {"pt-PT": "pt-BR"}}. Raises
+    ValueError if the file exists but is not a valid graph.
+    """
+    parents = {locale: reference_locale for locale in locales if locale != reference_locale}
+
+    if graph_path is None or not graph_path.exists():
+        return parents
+
+    try:
+        with open(graph_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Locale graph: cannot read {graph_path}: {e}")
+
+    declared = config.get('parents') if isinstance(config, dict) else None
+    if not isinstance(declared, dict) or not all(isinstance(p, str) for p in declared.values()):
+        raise ValueError(f"Locale graph: {graph_path} must contain {{\"parents\": {{\"locale\": \"parent\"}}}}")
+
+    for locale, parent in declared.items():
+        if locale not in parents:
+            print(f"⚠️  Locale graph: ignoring unknown locale '{locale}'")
+            continue
+        if parent != reference_locale and parent not in parents:
+            raise ValueError(f"Locale graph: parent '{parent}' of '{locale}' not found")
+        parents[locale] = parent
+
+    return parents
+
+
+def topological_order(parents: Dict[str, str], reference_locale: str) -> List[str]:
+    """Order locales so that every parent is processed before its children."""
+    children = {}
+    for locale, parent in parents.items():
+        children.setdefault(parent, []).append(locale)
+
+    order = []
+    queue = [reference_locale]
+    while queue:
+        current = queue.pop(0)
+        for child in sorted(children.get(current, [])):
+            order.append(child)
+            queue.append(child)
+
+    if len(order) != len(parents):
+        cyclic = sorted(set(parents) - set(order))
+        raise ValueError(f"Locale graph contains a cycle: {', '.join(cyclic)}")
+
+    return order
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse a 1-based 'I/N' shard specification."""
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected I/N")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', I must be between 1 and N")
+    return index, total
+
+
+def assign_shards(json_files: List[Path], total: int) -> List[Set[str]]:
+    """Split locales into balanced shards.
+    
+    Every locale is checked against the same reference keys, so each one
+    costs about the same and locales are dealt round-robin in name order.
+    The result depends only on locale names, never on file sizes that
+    change as files are synced, so every CI worker computes the same
+    assignment.
+    """
+    shards = [set() for _ in range(total)]
+    
+    for position, json_file in enumerate(sorted(json_files, key=lambda f: f.stem)):
+        shards[position % total].add(json_file.stem)
+    
+    return shards
+
+
+def with_ancestors(order: List[str], selected: Set[str], parents: Dict[str, str],
+                   reference_locale: str) -> List[str]:
+    """Narrow a topological order to the selected locales and their ancestors."""
+    needed = set()
+    for locale in selected:
+        while locale != reference_locale and locale not in needed:
+            needed.add(locale)
+            locale = parents[locale]
+    return [locale for locale in order if locale in needed]
+
+
+def sync_variant(json_file: Path, translation_data: Dict[str, Any], reference_data: Dict[str, Any],
+                 parent_data: Dict[str, Any], parent: str, prune: bool,
+                 dry_run: bool) -> Tuple[Dict[str, Any], bool]:
+    """Check a sparse variant against its parent, pruning it if requested.
+    
+    Returns the summary item of the variant and False if saving failed.
+    """
+    overrides, orphan_keys, copied_keys = split_overlay(reference_data, translation_data, parent_data)
+    override_count = sum(len(get_leaf_keys(value, key)) for key, value in overrides.items())
+    item = {
+        'file': json_file.name,
+        'parent': parent,
+        'status': 'complete',
+        'missing': 0,
+        'pruned': 0,
+        'total': override_count
+    }
+    
+    if not orphan_keys and not copied_keys:
+        print(f"  ✅ Complete ({override_count} overrides, other keys inherited from {parent})")
+        return item, True
+    
+    if orphan_keys:
+        print(f"  🗑️  Found {len(orphan_keys)} orphan keys")
+    if copied_keys:
+        print(f"  📋 Found {len(copied_keys)} values identical to {parent}")
+    
+    if not prune:
+        print(f"  💡 Use --prune to remove them; copies are then inherited from {parent}")
+        return item, True
+    
+    item['pruned'] = len(orphan_keys) + len(copied_keys)
+    
+    if dry_run:
+        print(f"  📝 [DRY RUN] Keys that would be pruned:")
+        for key in (orphan_keys + copied_keys)[:5]:
+            print(f"    - {key}")
+        if item['pruned'] > 5:
+            print(f"    ... and {item['pruned'] - 5} more")
+        return item, True
+    
+    if not save_json_file(json_file, overrides):
+        print(f"  ❌ Error saving {json_file.name}")
+        item['status'] = 'error'
+        return item, False
+    
+    print(f"  ✅ Pruned {item['pruned']} keys ({override_count} overrides left)")
+    item['status'] = 'updated'
+    return item, True
 
 
 def sync_translations(messages_dir: Path, reference_file: str = 'en-US.json', 
-                     mark_as_untranslated: bool = True, dry_run: bool = False) -> None:
-    """Synchronize all translations using a reference file."""
+                     mark_as_untranslated: bool = True, dry_run: bool = False,
+                     locale_graph: Optional[Path] = None, prune: bool = False,
+                     shard: Optional[Tuple[int, int]] = None) -> int:
+    """Synchronize all translations using a reference file; return the number of errors.
+
+    Locales are processed in topological order of the locale graph. Each
+    locale's resolved tree is cached so its children reuse it instead of
+    resolving the whole ancestor chain again; variants compare their own
+    keys against it to find copies of the parent. With a shard, only that
+    shard's locales are updated; their ancestors are resolved in memory.
+    """
     
     # Load reference file
     reference_path = messages_dir / reference_file
     if not reference_path.exists():
         print(f"Reference file not found: {reference_path}")
-        return
+        return 1
     
     print(f"Loading reference file: {reference_file}")
     reference_data = load_json_file(reference_path)
     if not reference_data:
         print("Error loading reference file")
-        return
+        return 1
     
     # Find all JSON files in the folder
     json_files = [f for f in messages_dir.glob('*.json') if f.name != reference_file]
     
     if not json_files:
         print("No translation files found")
-        return
+        return 0
+    
+    reference_locale = reference_path.stem
+    files_by_locale = {f.stem: f for f in json_files}
+    
+    try:
+        parents = load_locale_graph(locale_graph, list(files_by_locale), reference_locale)
+        order = topological_order(parents, reference_locale)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    selected = set(files_by_locale)
+    if shard:
+        selected = assign_shards(json_files, shard[1])[shard[0] - 1]
+        order = with_ancestors(order, selected, parents, reference_locale)
     
     total_keys_reference = len(get_all_keys(reference_data))
     print(f"Reference file contains {total_keys_reference} keys")
-    print(f"Processing {len(json_files)} translation files...\n")
+    if shard:
+        print(f"Shard {shard[0]}/{shard[1]}: processing {len(selected)} of {len(json_files)} translation files...\n")
+    else:
+        print(f"Processing {len(json_files)} translation files...\n")
     
     summary = []
+    errors = 0
+    # Resolved trees hold translated keys only; nothing falls back to the reference
+    resolved = {reference_locale: {}}
     
-    for json_file in sorted(json_files):
-        print(f"Processing: {json_file.name}")
+    for locale in order:
+        json_file = files_by_locale[locale]
+        parent = parents[locale]
+        
+        if locale not in selected:
+            # Ancestor from another shard: resolve it without reporting or saving
+            own_data = load_locale_file(json_file)
+            if parent in resolved and own_data is not None:
+                resolved[locale] = resolve_locale(reference_data, resolved[parent], own_data)
+            continue
+        
+        if parent == reference_locale:
+            print(f"Processing: {json_file.name}")
+        else:
+            print(f"Processing: {json_file.name} (inherits {parent})")
+        
+        if parent not in resolved:
+            print(f"  ❌ Skipped: parent {parent} could not be resolved")
+            errors += 1
+            continue
         
         # Load translation file
-        translation_data = load_json_file(json_file)
-        if not translation_data:
+        translation_data = load_locale_file(json_file)
+        
+        if translation_data is None or (parent == reference_locale and not translation_data):
             print(f"  ❌ Error loading {json_file.name}")
+            errors += 1
+            continue
+        
+        if parent != reference_locale:
+            # Variants stay sparse: keys they do not override are inherited
+            # from the parent when messages are compiled, never copied here
+            item, saved = sync_variant(json_file, translation_data, reference_data,
+                                       resolved[parent], parent, prune, dry_run)
+            resolved[locale] = resolve_locale(reference_data, resolved[parent], translation_data)
+            if not saved:
+                errors += 1
+            summary.append(item)
+            print()
             continue
         
         # Find missing keys
         missing_keys = find_missing_keys(reference_data, translation_data)
         current_keys = len(get_all_keys(translation_data))
         
-        if not missing_keys:
+        updated_data, pruned_keys = merge_missing_keys(
+            reference_data, translation_data, mark_as_untranslated, prune)
+        resolved[locale] = resolve_locale(reference_data, resolved[parent], updated_data)
+        
+        if not missing_keys and not pruned_keys:
             print(f"  ✅ Complete ({current_keys}/{total_keys_reference} keys)")
             summary.append({
                 'file': json_file.name,
                 'status': 'complete',
                 'missing': 0,
+                'pruned': 0,
                 'total': current_keys
             })
             continue
         
-        print(f"  🔍 Found {len(missing_keys)} missing keys")
+        if missing_keys:
+            print(f"  🔍 Found {len(missing_keys)} missing keys")
+        if pruned_keys:
+            print(f"  🗑️  Found {len(pruned_keys)} orphan keys to prune")
+        
+        new_total = len(get_all_keys(updated_data))
         
         if dry_run:
-            print(f"  📝 [DRY RUN] Keys that would be added:")
-            for key in missing_keys[:5]:  # Show only first 5
-                print(f"    - {key}")
-            if len(missing_keys) > 5:
-                print(f"    ... and {len(missing_keys) - 5} more")
+            if missing_keys:
+                print(f"  📝 [DRY RUN] Keys that would be added:")
+                for key in missing_keys[:5]:  # Show only first 5
+                    print(f"    - {key}")
+                if len(missing_keys) > 5:
+                    print(f"    ... and {len(missing_keys) - 5} more")
+            if pruned_keys:
+                print(f"  📝 [DRY RUN] Keys that would be pruned:")
+                for key in pruned_keys:
+                    print(f"    - {key}")
         else:
-            # Add missing keys
-            updated_data = add_missing_keys(reference_data, translation_data, 
-                                          missing_keys, mark_as_untranslated)
-            
             # Save updated file
             if save_json_file(json_file, updated_data):
-                print(f"  ✅ Updated successfully ({current_keys + len(missing_keys)}/{total_keys_reference} keys)")
+                print(f"  ✅ Updated successfully ({new_total}/{total_keys_reference} keys)")
+                if pruned_keys:
+                    print(f"  🗑️  Pruned keys:")
+                    for key in pruned_keys:
+                        print(f"    - {key}")
                 summary.append({
                     'file': json_file.name,
                     'status': 'updated',
                     'missing': len(missing_keys),
-                    'total': current_keys + len(missing_keys)
+                    'pruned': len(pruned_keys),
+                    'total': new_total
                 })
             else:
                 print(f"  ❌ Error saving {json_file.name}")
+                errors += 1
                 summary.append({
                     'file': json_file.name,
                     'status': 'error',
                     'missing': len(missing_keys),
+                    'pruned': len(pruned_keys),
                     'total': current_keys
                 })
         
@@ -213,18 +580,24 @@ def sync_translations(messages_dir: Path, reference_file: str = 'en-US.json',
             'error': '❌'
         }.get(item['status'], '❓')
         
-        print(f"{status_icon} {item['file']:<15} - {item['total']}/{total_keys_reference} keys", end='')
+        if item.get('parent'):
+            print(f"{status_icon} {item['file']:<15} - {item['total']} overrides of {item['parent']}", end='')
+        else:
+            print(f"{status_icon} {item['file']:<15} - {item['total']}/{total_keys_reference} keys", end='')
         
+        changes = []
         if item['missing'] > 0:
-            print(f" (+{item['missing']} added)" if item['status'] == 'updated' else f" ({item['missing']} missing)")
-        else:
-            print()
+            changes.append(f"+{item['missing']} added" if item['status'] == 'updated' else f"{item['missing']} missing")
+        if item['pruned'] > 0:
+            changes.append(f"-{item['pruned']} pruned" if item['status'] == 'updated' else f"{item['pruned']} orphans")
+        
+        print(f" ({', '.join(changes)})" if changes else '')
+    
+    return errors
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Synchronize translations using en-US.json as reference'
-    )
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the command line arguments of this script."""
     parser.add_argument(
         '--messages-dir', 
         type=Path,
@@ -246,9 +619,27 @@ def main():
         action='store_true',
         help='Only show what would be changed without making modifications'
     )
-    
-    args = parser.parse_args()
-    
+    parser.add_argument(
+        '--locale-graph',
+        type=Path,
+        default=Path(__file__).parent.parent / 'locale-graph.json',
+        help='Locale inheritance graph (default: ../locale-graph.json, optional)'
+    )
+    parser.add_argument(
+        '--prune',
+        action='store_true',
+        help='Remove keys that no longer exist in the reference file'
+    )
+    parser.add_argument(
+        '--shard',
+        type=parse_shard,
+        metavar='I/N',
+        help='Only synchronize the files of shard I out of N (e.g. 1/4)'
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the script with already parsed arguments."""
     if not args.messages_dir.exists():
         print(f"Directory not found: {args.messages_dir}")
         return 1
@@ -257,16 +648,28 @@ def main():
     print(f"Reference: {args.reference}")
     print(f"Mark untranslated: {not args.no_mark_untranslated}")
     print(f"Dry run: {args.dry_run}")
+    print(f"Prune orphans: {args.prune}")
     print("-" * 60)
     
-    sync_translations(
+    errors = sync_translations(
         messages_dir=args.messages_dir,
         reference_file=args.reference,
         mark_as_untranslated=not args.no_mark_untranslated,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        locale_graph=args.locale_graph,
+        prune=args.prune,
+        shard=args.shard
     )
     
-    return 0
+    return 1 if errors else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description='Synchronize translations using en-US.json as reference'
+    )
+    add_arguments(parser)
+    return run(parser.parse_args(argv))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests for the ICU message parser of compile_messages.py.
+Run from apps/web/scripts with: python3 -m unittest test_compile_messages
+"""
+
+import unittest
+
+from compile_messages import (
+    MessageSyntaxError, parse_message, compile_catalog,
+    TYPE_LITERAL, TYPE_ARGUMENT, TYPE_NUMBER, TYPE_DATE, TYPE_SELECT,
+    TYPE_PLURAL, TYPE_POUND, TYPE_TAG, SKELETON_TYPE_NUMBER, SKELETON_TYPE_DATETIME
+)
+
+
+def literal(value):
+    return {'type': TYPE_LITERAL, 'value': value}
+
+
+class ParserTestCase(unittest.TestCase):
+
+    def assertSyntaxError(self, message, text, offset):
+        with self.assertRaises(MessageSyntaxError) as context:
+            parse_message(message)
+        self.assertIn(text, str(context.exception))
+        self.assertEqual(context.exception.offset, offset)
+
+
+class TestArguments(ParserTestCase):
+
+    def test_literal_and_argument(self):
+        self.assertEqual(parse_message("Hello {name}!"), [
+            literal("Hello "),
+            {'type': TYPE_ARGUMENT, 'value': 'name'},
+            literal("!")
+        ])
+
+    def test_number_style(self):
+        self.assertEqual(parse_message("{n, number, percent}"), [
+            {'type': TYPE_NUMBER, 'value': 'n', 'style': 'percent'}
+        ])
+
+    def test_number_skeleton(self):
+        self.assertEqual(parse_message("{n, number, ::currency/USD compact-short}"), [{
+            'type': TYPE_NUMBER,
+            'value': 'n',
+            'style': {
+                'type': SKELETON_TYPE_NUMBER,
+                'tokens': [
+                    {'stem': 'currency', 'options': ['USD']},
+                    {'stem': 'compact-short', 'options': []}
+                ],
+                'parsedOptions': {}
+            }
+        }])
+
+    def test_date_skeleton(self):
+        self.assertEqual(parse_message("{d, date, ::yyyyMMdd}"), [{
+            'type': TYPE_DATE,
+            'value': 'd',
+            'style': {'type': SKELETON_TYPE_DATETIME, 'pattern': 'yyyyMMdd', 'parsedOptions': {}}
+        }])
+
+    def test_invalid_skeletons(self):
+        self.assertSyntaxError("{n, number, ::}", "Expected number skeleton", 11)
+        self.assertSyntaxError("{n, number, ::currency/}", "Invalid number skeleton", 11)
+
+
+class TestPluralAndSelect(ParserTestCase):
+
+    def test_plural(self):
+        self.assertEqual(parse_message("{count, plural, =0 {none} one {# file} other {# files}}"), [{
+            'type': TYPE_PLURAL,
+            'value': 'count',
+            'options': {
+                '=0': {'value': [literal("none")]},
+                'one': {'value': [{'type': TYPE_POUND}, literal(" file")]},
+                'other': {'value': [{'type': TYPE_POUND}, literal(" files")]}
+            },
+            'offset': 0,
+            'pluralType': 'cardinal'
+        }])
+
+    def test_plural_offset_and_ordinal(self):
+        [plural] = parse_message("{n, plural, offset:1 one {x} other {y}}")
+        self.assertEqual(plural['offset'], 1)
+
+        [ordinal] = parse_message("{n, selectordinal, one {#st} other {#th}}")
+        self.assertEqual(ordinal['pluralType'], 'ordinal')
+
+    def test_select(self):
+        self.assertEqual(parse_message("{role, select, admin {Admin} other {User}}"), [{
+            'type': TYPE_SELECT,
+            'value': 'role',
+            'options': {
+                'admin': {'value': [literal("Admin")]},
+                'other': {'value': [literal("User")]}
+            }
+        }])
+
+    def test_pound_is_literal_outside_plural(self):
+        self.assertEqual(parse_message("{role, select, other {#1}}")[0]['options']['other'],
+                         {'value': [literal("#1")]})
+
+    def test_option_errors(self):
+        self.assertSyntaxError("{n, plural, one {x}}", "Missing 'other'", 0)
+        self.assertSyntaxError("{n, plural, few {a} few {b} other {c}}", "Duplicate selector", 20)
+        self.assertSyntaxError("{n, plural, lots {a} other {b}}", "Invalid plural selector", 12)
+        self.assertSyntaxError("{n, plural, other {a}", "Unclosed plural argument", 0)
+
+
+class TestClosingBrace(ParserTestCase):
+
+    def test_top_level_closing_brace_is_literal(self):
+        self.assertEqual(parse_message("a}b"), [literal("a}b")])
+        self.assertEqual(parse_message("{name}}"), [{'type': TYPE_ARGUMENT, 'value': 'name'}, literal("}")])
+
+    def test_closing_brace_ends_option(self):
+        self.assertEqual(parse_message("{r, select, other {x}} y}")[1], literal(" y}"))
+
+
+class TestQuoting(ParserTestCase):
+
+    def test_escaped_apostrophe(self):
+        self.assertEqual(parse_message("It''s"), [literal("It's")])
+
+    def test_lone_apostrophe(self):
+        self.assertEqual(parse_message("It's {name}'s"), [
+            literal("It's "),
+            {'type': TYPE_ARGUMENT, 'value': 'name'},
+            literal("'s")
+        ])
+
+    def test_quoted_syntax(self):
+        self.assertEqual(parse_message("'{name}' and '<b>'"), [literal("{name} and <b>")])
+
+    def test_quoted_pound_in_plural(self):
+        [plural] = parse_message("{n, plural, other {'#' #}}")
+        self.assertEqual(plural['options']['other']['value'], [literal("# "), {'type': TYPE_POUND}])
+
+
+class TestTags(ParserTestCase):
+
+    def test_nested_tags(self):
+        self.assertEqual(parse_message("<b>Hi <i>{name}</i></b>"), [{
+            'type': TYPE_TAG,
+            'value': 'b',
+            'children': [
+                literal("Hi "),
+                {'type': TYPE_TAG, 'value': 'i', 'children': [{'type': TYPE_ARGUMENT, 'value': 'name'}]}
+            ]
+        }])
+
+    def test_self_closing_tag_is_literal(self):
+        self.assertEqual(parse_message("x <br/> y"), [literal("x "), literal("<br/>"), literal(" y")])
+        self.assertEqual(parse_message("<br />"), [literal("<br/>")])
+
+    def test_closing_brace_in_top_level_tag_is_literal(self):
+        self.assertEqual(parse_message("<b>a}b</b>"), [
+            {'type': TYPE_TAG, 'value': 'b', 'children': [literal("a}b")]}
+        ])
+
+    def test_less_than_is_literal(self):
+        self.assertEqual(parse_message("a < b"), [literal("a < b")])
+
+    def test_tag_errors(self):
+        self.assertSyntaxError("<b>bold", "Unclosed tag <b>", 0)
+        self.assertSyntaxError("<b>bold</i>", "Mismatched closing tag", 10)
+        self.assertSyntaxError("bold</b>", "Unexpected closing tag", 4)
+        self.assertSyntaxError("{n, plural, other {<b>x}</b>}}", "Unclosed tag <b>", 23)
+
+
+class TestErrorOffsets(ParserTestCase):
+
+    def test_argument_errors(self):
+        self.assertSyntaxError("Hi {name", "Unclosed argument", 3)
+        self.assertSyntaxError("{}", "Expected argument name", 1)
+        self.assertSyntaxError("{n, currency}", "Unknown argument type 'currency'", 4)
+
+    def test_compile_catalog_collects_errors(self):
+        compiled, errors = compile_catalog({'ok': "Hi", 'nested': {'bad': "Hi {name"}})
+        self.assertEqual(compiled, {'ok': [literal("Hi")], 'nested': {}})
+        self.assertEqual(errors, [('nested.bad', "Unclosed argument '{name'", 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the n-gram index of suggest_translations.py.
+Run from apps/web/scripts with: python3 -m unittest test_suggest_translations
+"""
+
+import unittest
+from pathlib import Path
+
+from suggest_translations import (
+    load_json_file, get_all_string_values, get_ngrams, build_reference_index
+)
+
+
+REFERENCE_PATH = Path(__file__).parent.parent / 'messages' / 'en-US.json'
+
+
+def brute_force(strings, text, min_score, exclude=None):
+    """Score the query against every string without any filtering."""
+    grams = get_ngrams(text)
+    results = []
+    for key, other_grams in strings.items():
+        shared = len(grams & other_grams)
+        score = 2 * shared / (len(grams) + len(other_grams))
+        if key != exclude and shared and score >= min_score:
+            results.append((key, score))
+    results.sort(key=lambda item: (-item[1], item[0]))
+    return results
+
+
+class TestNGramIndex(unittest.TestCase):
+
+    def assertMatchesBruteForce(self, strings, thresholds):
+        index = build_reference_index(strings)
+        grams = {key: get_ngrams(text) for key, text in strings.items()}
+        for min_score in thresholds:
+            for key, text in strings.items():
+                with self.subTest(min_score=min_score, key=key):
+                    self.assertEqual(index.query(text, min_score, exclude=key),
+                                     brute_force(grams, text, min_score, exclude=key))
+
+    def test_score_equal_to_threshold(self):
+        # 8 and 12 n-grams sharing 8 score exactly 0.8
+        index = build_reference_index({'new': "New Password", 'other': "Passport"})
+        self.assertEqual(index.query("Password", 0.8), [('new', 0.8)])
+
+    def test_small_catalog(self):
+        strings = {
+            'a': "Password", 'b': "New Password", 'c': "Confirm New Password",
+            'd': "Share", 'e': "Reverse Share", 'f': "Delete share", 'g': "Delete shares",
+            'h': "", 'i': "ok"
+        }
+        self.assertMatchesBruteForce(strings, [0, 0.1, 0.3, 0.5, 0.6, 0.75, 0.8, 0.9, 1])
+
+    @unittest.skipUnless(REFERENCE_PATH.exists(), "reference messages not found")
+    def test_reference_catalog(self):
+        strings = dict(get_all_string_values(load_json_file(REFERENCE_PATH)))
+        self.assertMatchesBruteForce(strings, [0.3, 0.6, 0.8])
+
+
+if __name__ == '__main__':
+    unittest.main()
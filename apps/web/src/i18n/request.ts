@@ -1,7 +1,15 @@
 import { cookies } from "next/headers";
 import { getRequestConfig } from "next-intl/server";
 
-const supportedLocales = [
+import localeGraph from "../../locale-graph.json";
+
+type Messages = Record<string, unknown>;
+
+// Regional variants only store their overrides; every other key is
+// inherited from the parent declared in locale-graph.json
+const localeParents: Record<string, string> = localeGraph.parents;
+
+const baseLocales = [
   "en-US",
   "pt-BR",
   "fr-FR",
@@ -19,9 +27,33 @@ const supportedLocales = [
   "ko-KR",
 ];
 
+const supportedLocales = [...baseLocales, ...Object.keys(localeParents)];
+
 const envDefault = process.env.NEXT_PUBLIC_DEFAULT_LANGUAGE || "en-US";
 const DEFAULT_LOCALE = supportedLocales.includes(envDefault) ? envDefault : "en-US";
 
+function isMessageGroup(value: unknown): value is Messages {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+function mergeMessages(parent: Messages, child: Messages): Messages {
+  const merged: Messages = { ...parent };
+
+  for (const [key, value] of Object.entries(child)) {
+    const inherited = merged[key];
+    merged[key] = isMessageGroup(value) && isMessageGroup(inherited) ? mergeMessages(inherited, value) : value;
+  }
+
+  return merged;
+}
+
+async function loadMessages(locale: string): Promise<Messages> {
+  const messages: Messages = (await import(`../../messages/${locale}.json`)).default;
+  const parent = localeParents[locale];
+
+  return parent ? mergeMessages(await loadMessages(parent), messages) : messages;
+}
+
 export default getRequestConfig(async ({ locale }) => {
   const cookieStore = cookies();
   const cookiesList = await cookieStore;
@@ -33,12 +65,12 @@ export default getRequestConfig(async ({ locale }) => {
   try {
     return {
       locale: finalLocale,
-      messages: (await import(`../../messages/${finalLocale}.json`)).default,
+      messages: await loadMessages(finalLocale),
     };
   } catch {
     return {
       locale: DEFAULT_LOCALE,
-      messages: (await import(`../../messages/${DEFAULT_LOCALE}.json`)).default,
+      messages: await loadMessages(DEFAULT_LOCALE),
     };
   }
 });